@@ -0,0 +1,140 @@
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Leak regression check: shows and hides toasts for many cycles and fails
+# when RSS or the number of live toasts, widgets and QObjects keeps growing.
+#
+#   python benchmarks/leak.py [-n 10000] [--rss-limit 8] [-o leak.json]
+#
+# Exits with status 1 when a scenario leaks.
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5 import QtCore, QtWidgets
+
+from pyqtToast import Toast, ToastPool, ToastDispatcher, toastMetrics, imageLoader, pixmapCache
+from toasts import _rss, _config, _drain, _image
+
+_GROWTH = ("toasts", "wrappers", "widgets", "qobjects", "qobject_wrappers")
+
+def _live(app) -> dict:
+    gc.collect()
+    return {
+        "rss": _rss(),
+        "toasts": toastMetrics().live(),
+        "wrappers": sum(1 for o in gc.get_objects() if isinstance(o, Toast)),
+        "widgets": len(app.allWidgets()),
+        # Timers, animations, models and sound effects are children of the application or of a window,
+        # parentless objects are only seen through their Python wrappers
+        "qobjects": len(app.findChildren(QtCore.QObject)) + sum(1 + len(w.findChildren(QtCore.QObject)) for w in app.topLevelWidgets()),
+        "qobject_wrappers": sum(1 for o in gc.get_objects() if isinstance(o, QtCore.QObject)),
+    }
+
+def _scenario(app, n: int, samples: int, cycle) -> dict:
+    # The first sample is taken after a warm up so caches and allocators have settled
+    step = max(1, n // samples)
+    for i in range(step):
+        cycle(i)
+    base = _live(app)
+    history = [base]
+    t = time.perf_counter()
+    for i in range(n):
+        cycle(i)
+        if (i + 1) % step == 0:
+            history.append(_live(app))
+    elapsed = time.perf_counter() - t
+    last = history[-1]
+    result = {
+        "n": n,
+        "per_cycle_us": elapsed / n * 1e6,
+        "rss_growth": last["rss"] - base["rss"],
+    }
+    for key in _GROWTH:
+        result[key + "_growth"] = last[key] - base[key]
+    result["samples"] = history
+    return result
+
+def run(n: int, samples: int = 10, image: str = "") -> dict:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    toastMetrics()
+
+    def standalone(i):
+        toast = Toast(config=_config(i))
+        toast.show()
+        app.processEvents()
+        toast._hide(True)
+        _drain(app)
+
+    pool = ToastPool(maxSize=4)
+    def pooled(i):
+        toast = pool.acquire(_config(i))
+        toast.show()
+        app.processEvents()
+        toast._hide(True)
+        _drain(app)
+
+    dispatcher = ToastDispatcher(maxVisible=3, rate=1e9, burst=1000)
+    def dispatched(i):
+        dispatcher.notify(_config(i), key="k%d" % (i % 5))
+        app.processEvents()
+        for toast in list(dispatcher._shown):
+            toast._hide(True)
+        _drain(app)
+
+    def expiring(i):
+        # Decoded on a worker every cycle and hidden by the expiry scheduler instead of _hide(True)
+        config = _config(i, image)
+        config.DURATION = 1
+        toast = Toast(config=config)
+        hidden = []
+        toast.popuphidden.connect(lambda: hidden.append(True))
+        pixmapCache.clear()
+        toast.show()
+        imageLoader().waitForDone()
+        deadline = time.monotonic() + 1.0
+        while len(hidden) == 0 and time.monotonic() < deadline:
+            app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+        _drain(app)
+
+    return {
+        "standalone": _scenario(app, n, samples, standalone),
+        "pool": _scenario(app, n, samples, pooled),
+        "dispatcher": _scenario(app, n, samples, dispatched),
+        "expiring": _scenario(app, n, samples, expiring),
+    }
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="pyqtToast leak regression check")
+    parser.add_argument("-n", "--cycles", type=int, default=10000, help="show/hide cycles per scenario")
+    parser.add_argument("--rss-limit", type=float, default=8.0, help="allowed RSS growth in MB")
+    parser.add_argument("-o", "--output", default=None, help="write results as JSON to this file")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        image = os.path.join(tmpdir, "avatar.png")
+        _image(image, 256)
+        results = run(args.cycles, image=image)
+    failed = []
+    for name, result in results.items():
+        if result["rss_growth"] > args.rss_limit * 1024 * 1024:
+            failed.append("%s: RSS grew by %.1f MB" % (name, result["rss_growth"] / 1024 / 1024))
+        for key in _GROWTH:
+            if result[key + "_growth"] > 0:
+                failed.append("%s: %s_growth is %d" % (name, key, result[key + "_growth"]))
+    results["failed"] = failed
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    for name in ("standalone", "pool", "dispatcher", "expiring"):
+        result = results[name]
+        print("%-10s %6d cycles  %8.1f us/cycle  rss %+8.1f KB  toasts %+d  widgets %+d  qobjects %+d" % (
+            name, result["n"], result["per_cycle_us"], result["rss_growth"] / 1024, result["toasts_growth"], result["widgets_growth"], result["qobjects_growth"]))
+    for line in failed:
+        print("LEAK", line)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+
+# Startup benchmark: import cost and first toast latency, each measured in a
+# fresh interpreter so module caches do not hide the real cost.
+#
+#   QT_QPA_PLATFORM=offscreen python benchmarks/startup.py [-o startup.json] [-n 5]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SCENARIOS = {
+    "import_config": ("qtwidgets_loaded", """
+import sys, time
+t = time.perf_counter()
+import pyqtToast
+pyqtToast.Config()
+elapsed = time.perf_counter() - t
+print(elapsed, "PyQt5.QtWidgets" in sys.modules)
+"""),
+    "import_toast": ("qtwidgets_loaded", """
+import sys, time
+t = time.perf_counter()
+from pyqtToast import Toast
+elapsed = time.perf_counter() - t
+print(elapsed, "PyQt5.QtWidgets" in sys.modules)
+"""),
+    "first_toast": ("qtmultimedia_loaded", """
+import sys, time
+t = time.perf_counter()
+from PyQt5 import QtWidgets
+from pyqtToast import Toast
+app = QtWidgets.QApplication(sys.argv[:1])
+toast = Toast("Title", "Message", duration=0)
+toast.show()
+while not toast.isVisible():
+    app.processEvents()
+app.processEvents()
+elapsed = time.perf_counter() - t
+print(elapsed, "PyQt5.QtMultimedia" in sys.modules)
+"""),
+}
+
+def _run(code: str):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    out = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout.split()
+    return float(out[-2]), out[-1] == "True"
+
+def run(repeat: int = 5) -> dict:
+    results = dict()
+    for name, (flag, code) in _SCENARIOS.items():
+        times = []
+        for _ in range(repeat):
+            elapsed, loaded = _run(code)
+            times.append(elapsed * 1000)
+        times.sort()
+        results[name] = {"min_ms": times[0], "median_ms": times[len(times) // 2], "max_ms": times[-1], flag: loaded}
+    return results
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="pyqtToast startup benchmark")
+    parser.add_argument("-o", "--output", default=None, help="write results as JSON to this file")
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+    results = run(args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
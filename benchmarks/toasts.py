@@ -0,0 +1,243 @@
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Offscreen benchmark suite for toast creation, layout, painting and animation.
+#
+#   python benchmarks/toasts.py [-o toasts.json] [-s scale]
+#
+# Every scenario reports per-operation timings in microseconds. Results are
+# written as JSON so runs can be compared for regressions.
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+import pyqtToast
+from pyqtToast import Config, Toast, ToastPool, ToastStack, ToastRenderer, Button, Action, ActionType
+
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _stats(times: list) -> dict:
+    times = sorted(t * 1e6 for t in times)
+    n = len(times)
+    return {
+        "n": n,
+        "mean_us": sum(times) / n,
+        "median_us": times[n // 2],
+        "p95_us": times[min(n - 1, int(n * 0.95))],
+        "min_us": times[0],
+        "max_us": times[-1],
+    }
+
+def _config(i: int = 0, image: str = "") -> Config:
+    config = Config()
+    config.TITLE = "Title %d" % i
+    config.MESSAGE = "This is notification number %d" % i
+    config.APP_NAME = "bench"
+    config.IMAGE = image
+    config.DURATION = 0
+    config.ANIM_SHOW_HIDE_TIME = 0
+    config.BUTTONS["ok"] = Button("Ok")
+    config.ACTIONS["pick"] = Action(ActionType.SELECT, options=["a", "b", "c"])
+    return config
+
+def _image(path: str, size: int):
+    image = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32)
+    image.fill(QtGui.QColor(200, 80, 40))
+    image.save(path)
+
+def _drain(app):
+    app.processEvents()
+    app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+def bench_init(app, n: int) -> dict:
+    times = []
+    for i in range(n):
+        t = time.perf_counter()
+        toast = Toast(config=_config(i))
+        times.append(time.perf_counter() - t)
+        toast.deleteLater()
+    _drain(app)
+    return _stats(times)
+
+def bench_setup_ui(app, n: int, image: str) -> dict:
+    times = []
+    toast = Toast(config=_config(0, image))
+    for i in range(n):
+        toast.setConfig(_config(i, image))
+        t = time.perf_counter()
+        toast._setupUi()
+        times.append(time.perf_counter() - t)
+    toast.deleteLater()
+    _drain(app)
+    return _stats(times)
+
+def bench_setup_select(app, n: int, options: int) -> dict:
+    # A fresh toast per iteration, select actions are built from scratch every time
+    choices = tuple("option %d" % i for i in range(options))
+    times = []
+    for i in range(n):
+        config = _config(i)
+        config.ACTIONS = {"assignee": Action(ActionType.SELECT, "Assignee", choices)}
+        toast = Toast(config=config)
+        t = time.perf_counter()
+        toast._setupUi()
+        times.append(time.perf_counter() - t)
+        toast.deleteLater()
+    _drain(app)
+    return _stats(times)
+
+def bench_mask_image(app, n: int, tmpdir: str) -> dict:
+    results = dict()
+    for size in (64, 256, 1024, 2048):
+        path = os.path.join(tmpdir, "mask_%d.png" % size)
+        _image(path, size)
+        with open(path, "rb") as f:
+            data = f.read()
+        times = []
+        for _ in range(n):
+            t = time.perf_counter()
+            pyqtToast.images._maskImage(data, "png", 100, 1.0)
+            times.append(time.perf_counter() - t)
+        results[str(size)] = _stats(times)
+    return results
+
+def bench_paint(app, n: int) -> dict:
+    toast = Toast(config=_config())
+    toast.show()
+    _drain(app)
+    times = []
+    for _ in range(n):
+        t = time.perf_counter()
+        toast.repaint()
+        times.append(time.perf_counter() - t)
+    toast._hide(True)
+    _drain(app)
+    return _stats(times)
+
+def bench_show_latency(app, n: int) -> dict:
+    times = []
+    for i in range(n):
+        toast = Toast(config=_config(i))
+        t = time.perf_counter()
+        toast.show()
+        while not toast.isVisible():
+            app.processEvents()
+        app.processEvents()
+        times.append(time.perf_counter() - t)
+        toast._hide(True)
+        _drain(app)
+    return _stats(times)
+
+def bench_cycles(app, n: int, pooled: bool) -> dict:
+    pool = ToastPool(maxSize=4) if pooled else None
+    def cycle(i):
+        toast = pool.acquire(_config(i)) if pooled else Toast(config=_config(i))
+        toast.show()
+        app.processEvents()
+        toast._hide(True)
+        _drain(app)
+    # Warm up caches and allocators before taking the baseline
+    for i in range(min(n, 50)):
+        cycle(i)
+    gc.collect()
+    before = _rss()
+    t = time.perf_counter()
+    for i in range(n):
+        cycle(i)
+    elapsed = time.perf_counter() - t
+    gc.collect()
+    after = _rss()
+    result = {"n": n, "per_cycle_us": elapsed / n * 1e6, "rss_before": before, "rss_after": after, "rss_growth": after - before}
+    if pool is not None:
+        result["pool"] = pool.stats()
+        pool.clear()
+        _drain(app)
+    return result
+
+def bench_concurrent(app, n: int) -> dict:
+    stack = ToastStack()
+    toasts = []
+    t = time.perf_counter()
+    for i in range(n):
+        toast = Toast(config=_config(i))
+        stack.add(toast)
+        toast.show()
+        toasts.append(toast)
+    app.processEvents()
+    showAll = time.perf_counter() - t
+    frames = []
+    for _ in range(30):
+        f = time.perf_counter()
+        for toast in toasts:
+            toast.repaint()
+        app.processEvents()
+        frames.append(time.perf_counter() - f)
+    t = time.perf_counter()
+    for toast in toasts:
+        toast._hide(True)
+    app.processEvents()
+    hideAll = time.perf_counter() - t
+    _drain(app)
+    return {"n": n, "show_all_ms": showAll * 1000, "hide_all_ms": hideAll * 1000, "frame": _stats(frames)}
+
+def bench_render(app, n: int, image: str) -> dict:
+    renderer = ToastRenderer()
+    configs = [_config(i, image if i % 2 else "") for i in range(n)]
+    results = dict()
+    for name, png in (("qimage", False), ("png", True)):
+        times = []
+        t = time.perf_counter()
+        for _ in renderer.renderMany(configs, png):
+            times.append(time.perf_counter() - t)
+            t = time.perf_counter()
+        results[name] = _stats(times)
+    renderer.close()
+    _drain(app)
+    return results
+
+def run(scale: float = 1.0) -> dict:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    n = lambda count: max(1, int(count * scale))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        image = os.path.join(tmpdir, "avatar.png")
+        _image(image, 512)
+        results = {
+            "init": bench_init(app, n(200)),
+            "setup_ui": bench_setup_ui(app, n(200), ""),
+            "setup_ui_image": bench_setup_ui(app, n(200), image),
+            "setup_select": {"10": bench_setup_select(app, n(100), 10), "500": bench_setup_select(app, n(100), 500)},
+            "mask_image": bench_mask_image(app, n(20), tmpdir),
+            "paint": bench_paint(app, n(500)),
+            "show_latency": bench_show_latency(app, n(50)),
+            "cycles": bench_cycles(app, n(500), False),
+            "cycles_pool": bench_cycles(app, n(500), True),
+            "concurrent": bench_concurrent(app, n(60)),
+            "render": bench_render(app, n(500), image),
+        }
+    results["meta"] = {"python": sys.version.split()[0], "qt": QtCore.QT_VERSION_STR, "platform": app.platformName(), "scale": scale}
+    return results
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="pyqtToast offscreen benchmarks")
+    parser.add_argument("-o", "--output", default=None, help="write results as JSON to this file")
+    parser.add_argument("-s", "--scale", type=float, default=1.0, help="scale iteration counts")
+    args = parser.parse_args()
+    results = run(args.scale)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
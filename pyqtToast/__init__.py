@@ -0,0 +1,76 @@
+# Names are resolved lazily so `from pyqtToast import Config` does not load
+# QtWidgets, and the daemon client can be imported without Qt at all.
+
+_EXPORTS = {
+    "ImageCrop": "config",
+    "CurveType": "config",
+    "ImageAlign": "config",
+    "TextAlign": "config",
+    "ActionType": "config",
+    "ShowPosType": "config",
+    "ShowScreenType": "config",
+    "Vec2": "config",
+    "Color": "config",
+    "Action": "config",
+    "Button": "config",
+    "Config": "config",
+    "PixmapCache": "images",
+    "pixmapCache": "images",
+    "backgroundCache": "images",
+    "ImageLoader": "images",
+    "imageLoader": "images",
+    "SoundPlayer": "sound",
+    "soundPlayer": "sound",
+    "TextMeasurer": "layout",
+    "textMeasurer": "layout",
+    "OptionModels": "options",
+    "optionModels": "options",
+    "IconCache": "options",
+    "iconCache": "options",
+    "Toast": "toast",
+    "PoolEviction": "pool",
+    "ToastPool": "pool",
+    "ToastStack": "stack",
+    "ToastRenderer": "render",
+    "renderToast": "render",
+    "Theme": "theme",
+    "ThemeManager": "theme",
+    "themeManager": "theme",
+    "ScreenCache": "screens",
+    "screenCache": "screens",
+    "AnimationDriver": "driver",
+    "ToastDispatcher": "dispatcher",
+    "ExpiryScheduler": "expiry",
+    "expiryScheduler": "expiry",
+    "ToastReplay": "replay",
+    "ReplayEvent": "replay",
+    "loadStream": "replay",
+    "writeStream": "replay",
+    "poissonStream": "replay",
+    "ToastMetrics": "metrics",
+    "MetricsExporter": "metrics",
+    "toastMetrics": "metrics",
+    "HistoryEntry": "history",
+    "ToastHistory": "history",
+    "HistoryModel": "history",
+    "HistoryPanel": "history",
+    "ToastNotifier": "notifier",
+    "notify": "notifier",
+    "notifyAsync": "notifier",
+    "ToastDaemon": "daemon",
+    "ToastClient": "client",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    import importlib
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,109 @@
+from PyQt5 import QtWidgets
+import sys
+
+from . import toast as _toast
+from .config import CurveType, TextAlign, Button
+from .toast import Toast
+from .daemon import ToastDaemon
+
+def _demo():
+    from qt_material import apply_stylesheet
+    app = QtWidgets.QApplication(sys.argv)
+    _toast._EXIT_ON_HIDE = True
+    
+    toast = Toast()
+    toast.setTitle("Some Title")
+    toast.setMessage("This is notification for you")
+    #toast.setImage("images.png")
+    toast.setTextAlign(TextAlign.LEFT)
+    toast.setUseBlurBg(True)
+    toast.setAnimPosOffset(30, 0)
+    toast.setAnimPosCurve(CurveType.IN_CUBIC)
+    toast.setAnimFadeCurve(CurveType.IN_CUBIC)
+    toast.config.BUTTONS["btn1"] = Button("Play")
+    #toast.setSound("sound.wav")
+
+    apply_stylesheet(app, theme='dark_teal.xml')
+    toast.show()
+    sys.exit(app.exec_())
+
+def _daemon(args):
+    app = QtWidgets.QApplication(sys.argv[:1])
+    app.setQuitOnLastWindowClosed(False)
+    daemon = ToastDaemon(args.socket)
+    try:
+        daemon.listen()
+    except OSError as e:
+        sys.exit(str(e))
+    sys.exit(app.exec_())
+
+def _replay(args):
+    import os
+    import json
+    from PyQt5 import QtCore
+    if not args.onscreen:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        # The offscreen platform warns about window opacity on every frame of every fade
+        def handler(mode, context, message):
+            if "does not support" not in message:
+                sys.stderr.write(message + "\n")
+        QtCore.qInstallMessageHandler(handler)
+    app = QtWidgets.QApplication(sys.argv[:1])
+    from .config import Config
+    from .replay import loadStream, writeStream, poissonStream, speedUp, replay
+
+    events = loadStream(args.replay) if args.replay else []
+    if args.poisson:
+        templates = [event.config for event in events]
+        if len(templates) == 0:
+            templates = [Config(TITLE="Notification %d" % i, MESSAGE="Synthetic load", APP_NAME="replay") for i in range(16)]
+        events = poissonStream(templates, args.poisson, args.count, args.burst, args.seed)
+    if args.speed != 1.0:
+        events = speedUp(events, args.speed)
+    if args.save:
+        writeStream(args.save, events)
+
+    result = replay(events, target=args.target, duration=args.duration, useDriver=args.driver, maxVisible=args.max_visible,
+                    dispatchRate=args.dispatch_rate, drainMs=args.drain)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    latency = result["latency"]
+    print("%s: %d events in %.1f s, %d shown" % (result["target"], result["events"], result["elapsed_s"], result["shown"]))
+    if latency["n"] > 0:
+        print("show latency  p50 %.1f ms  p90 %.1f ms  p99 %.1f ms  max %.1f ms" % (latency["p50_ms"], latency["p90_ms"], latency["p99_ms"], latency["max_ms"]))
+    print("frames %d  dropped %d  worst gap %.1f ms" % (result["frames"], result["dropped_frames"], result["frame_gap"].get("max_ms", 0.0)))
+    print("peak visible %d  peak live %d  rss %.1f MB -> peak %.1f MB" % (result["peak_visible"], result["peak_live"],
+          result["rss_start"] / 1024 / 1024, result["rss_peak"] / 1024 / 1024))
+    if "dispatcher" in result:
+        print("dispatcher queued %(queued)d  coalesced %(coalesced)d  dropped %(dropped)d" % result["dispatcher"])
+    app.quit()
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m pyqtToast", description="pyqt5 notifications")
+    parser.add_argument("--daemon", action="store_true", help="run a notification daemon on a local socket")
+    parser.add_argument("--socket", default=None, help="socket path for the daemon")
+    replay = parser.add_argument_group("replay", "replay a JSONL stream or synthetic load against offscreen toasts")
+    replay.add_argument("--replay", metavar="JSONL", default=None, help="stream of {\"t\": seconds, \"config\": {...}} lines")
+    replay.add_argument("--poisson", metavar="RATE", type=float, default=None, help="synthetic arrivals per second, configs are taken from --replay if given")
+    replay.add_argument("--count", type=int, default=1000, help="number of synthetic notifications")
+    replay.add_argument("--burst", type=int, default=1, help="notifications per synthetic arrival")
+    replay.add_argument("--seed", type=int, default=None, help="seed for synthetic arrivals")
+    replay.add_argument("--speed", type=float, default=1.0, help="replay this many times faster")
+    replay.add_argument("--target", choices=("toast", "stack", "pool", "dispatcher"), default="stack", help="how toasts are shown")
+    replay.add_argument("--duration", type=int, default=None, help="override DURATION of every toast in ms")
+    replay.add_argument("--driver", action="store_true", help="animate through one shared AnimationDriver")
+    replay.add_argument("--max-visible", type=int, default=5, help="dispatcher and pool size")
+    replay.add_argument("--dispatch-rate", type=float, default=2.0, help="dispatcher toasts per second")
+    replay.add_argument("--drain", type=int, default=10000, help="ms to wait for shown toasts to hide after the last arrival")
+    replay.add_argument("--onscreen", action="store_true", help="use the real display instead of the offscreen platform")
+    replay.add_argument("--save", metavar="JSONL", default=None, help="write the replayed stream, e.g. to keep a synthetic run")
+    replay.add_argument("-o", "--output", default=None, help="write the report as JSON")
+    args = parser.parse_args()
+    if args.daemon:
+        _daemon(args)
+    elif args.replay or args.poisson:
+        _replay(args)
+    else:
+        _demo()
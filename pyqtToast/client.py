@@ -0,0 +1,106 @@
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# Tiny client for the pyqtToast daemon (python -m pyqtToast --daemon).
+# It does not import Qt, so sending a notification only costs a socket round trip.
+
+_FINAL_EVENTS = ("hidden", "coalesced", "dropped", "error")
+
+def requireUnixSockets():
+    # On Windows QLocalServer listens on a named pipe, which this client can not reach
+    if sys.platform == "win32" or not hasattr(socket, "AF_UNIX"):
+        raise OSError("the pyqtToast daemon and client need Unix domain sockets, on Windows use ToastNotifier inside the application")
+
+def defaultSocketPath() -> str:
+    return os.path.join(tempfile.gettempdir(), "pyqtToast-%s.sock" % getpass.getuser())
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def decode(line: bytes) -> dict:
+    return json.loads(line.decode("utf-8"))
+
+class ToastClient:
+    def __init__(self, path: str|None = None, timeout: float = 1.0):
+        requireUnixSockets()
+        self.path = path if path is not None else defaultSocketPath()
+        self.timeout = timeout
+        self._sock = None
+        self._buffer = b""
+        self._nextId = 1
+        self._callbacks = dict()
+
+    #------PRIVATES------
+
+    def _connect(self):
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(self.timeout)
+            self._sock.connect(self.path)
+        return self._sock
+
+    def _readMessage(self, timeout: float|None):
+        sock = self._connect()
+        sock.settimeout(timeout)
+        while b"\n" not in self._buffer:
+            data = sock.recv(4096)
+            if not data:
+                raise ConnectionError("notification daemon closed the connection")
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return decode(line)
+
+    #------PUBLIC------
+
+    def send(self, config: dict, callbacks: dict|None = None, priority: int = 0, key: str|None = None) -> int:
+        # config uses the Config attribute names, e.g. {"TITLE": "Build", "SHOW_POS": "TOP_RIGHT"}
+        # callbacks maps BUTTONS/ACTIONS names to callables, they run inside wait()
+        msgId = self._nextId
+        self._nextId += 1
+        message = {"id": msgId, "config": config, "priority": priority}
+        if key is not None:
+            message["key"] = key
+        if callbacks:
+            self._callbacks[msgId] = callbacks
+        self._connect().sendall(encode(message))
+        return msgId
+
+    def wait(self, msgId: int, timeout: float|None = None) -> str:
+        # Dispatch events until the notification is finished, returns the final event name
+        while True:
+            message = self._readMessage(timeout)
+            event = message.get("event")
+            callbacks = self._callbacks.get(message.get("id"), dict())
+            if event in ("button", "action"):
+                callback = callbacks.get(message.get("name"))
+                if callback is not None:
+                    if event == "action":
+                        callback(message.get("value"))
+                    else:
+                        callback()
+            elif event in _FINAL_EVENTS:
+                self._callbacks.pop(message.get("id"), None)
+                if message.get("id") in (msgId, None):
+                    return event
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+def notify(title: str, message: str = "", path: str|None = None, **config) -> None:
+    client = ToastClient(path)
+    try:
+        data = {"TITLE": title, "MESSAGE": message}
+        data.update(config)
+        client.send(data)
+    finally:
+        client.close()
+
+if __name__ == '__main__':
+    import sys
+    notify(sys.argv[1] if len(sys.argv) > 1 else "", " ".join(sys.argv[2:]))
@@ -0,0 +1,353 @@
+from PyQt5 import QtCore
+import json
+import base64
+from enum import Enum
+from typing import NamedTuple
+from collections.abc import Callable, Sequence
+
+class ImageCrop(Enum):
+    DEFAULT = 1
+    CIRCLE = 2
+
+class CurveType:
+    LINEAR = QtCore.QEasingCurve.Linear
+    IN_QUAD = QtCore.QEasingCurve.InQuad
+    OUT_QUAD = QtCore.QEasingCurve.OutQuad
+    IN_OUT_QUAD = QtCore.QEasingCurve.InOutQuad
+    OUT_IN_QUAD = QtCore.QEasingCurve.OutInQuad
+    IN_CUBIC = QtCore.QEasingCurve.InCubic
+    OUT_CUBIC = QtCore.QEasingCurve.OutCubic
+    IN_OUT_CUBIC = QtCore.QEasingCurve.InOutCubic
+    OUT_IN_CUBIC = QtCore.QEasingCurve.OutInCubic
+    IN_QUART = QtCore.QEasingCurve.InQuart
+    OUT_QUART = QtCore.QEasingCurve.OutQuart
+    IN_OUT_QUART = QtCore.QEasingCurve.InOutQuart
+    OUT_IN_QUART = QtCore.QEasingCurve.OutInQuart
+    IN_QUINT = QtCore.QEasingCurve.InQuint
+    OUT_QUINT = QtCore.QEasingCurve.OutQuint
+    IN_OUT_QUINT = QtCore.QEasingCurve.InOutQuint
+    OUT_IN_QUINT = QtCore.QEasingCurve.OutInQuint
+    IN_SINE = QtCore.QEasingCurve.InSine
+    OUT_SINE = QtCore.QEasingCurve.OutSine
+    IN_OUT_SINE = QtCore.QEasingCurve.InOutSine
+    OUT_IN_SINE = QtCore.QEasingCurve.OutInSine
+    IN_EXPO = QtCore.QEasingCurve.InExpo
+    OUT_EXPO = QtCore.QEasingCurve.OutExpo
+    IN_OUT_EXPO = QtCore.QEasingCurve.InOutExpo
+    OUT_IN_EXPO = QtCore.QEasingCurve.OutInExpo
+    IN_CIRC = QtCore.QEasingCurve.InCirc
+    OUT_CIRC = QtCore.QEasingCurve.OutCirc
+    IN_OUT_CIRC = QtCore.QEasingCurve.InOutCirc
+    OUT_IN_CIRC = QtCore.QEasingCurve.OutInCirc
+    IN_ELASTIC = QtCore.QEasingCurve.InElastic
+    OUT_ELASTIC = QtCore.QEasingCurve.OutElastic
+    IN_OUT_ELASTIC = QtCore.QEasingCurve.InOutElastic
+    OUT_IN_ELASTIC = QtCore.QEasingCurve.OutInElastic
+    IN_BACK = QtCore.QEasingCurve.InBack
+    OUT_BACK = QtCore.QEasingCurve.OutBack
+    IN_OUT_BACK = QtCore.QEasingCurve.InOutBack
+    OUT_IN_BACK = QtCore.QEasingCurve.OutInBack
+    IN_BOUNCE = QtCore.QEasingCurve.InBounce
+    OUT_BOUNCE = QtCore.QEasingCurve.OutBounce
+    IN_OUT_BOUNCE = QtCore.QEasingCurve.InOutBounce
+    OUT_IN_BOUNCE = QtCore.QEasingCurve.OutInBounce
+    IN_CURVE = QtCore.QEasingCurve.InCurve
+    OUT_CURVE = QtCore.QEasingCurve.OutCurve
+    SINE_CURVE = QtCore.QEasingCurve.SineCurve
+    COSINE_CURVE = QtCore.QEasingCurve.CosineCurve
+    BEZIER_SPLINE = QtCore.QEasingCurve.BezierSpline
+    TCB_SPLINE = QtCore.QEasingCurve.TCBSpline
+
+class ImageAlign(Enum):
+    LEFT = 1
+    RIGHT = 2
+
+class TextAlign(Enum):
+    LEFT = 1
+    RIGHT = 2
+    CENTER = 3
+
+class ActionType(Enum):
+    TEXT = 1
+    SELECT = 2
+
+class ShowPosType(Enum):
+    TOP_LEFT = 1
+    TOP_RIGHT = 2
+    BOTTOM_LEFT = 3
+    BOTTOM_RIGHT = 4
+
+class ShowScreenType(Enum):
+    PRIMARY = 1
+    CURSOR = 2
+    ACTIVE_WINDOW = 3
+    NAMED = 4
+
+class Vec2(NamedTuple):
+    x: int = 0
+    y: int = 0
+
+class Color(NamedTuple):
+    r: int = 255
+    g: int = 255
+    b: int = 255
+    a: int = 255
+
+class Action(NamedTuple):
+    type: ActionType
+    help: str = ""
+    options: Sequence[str] = ()
+    callback: Callable|None = None
+    style: str = ""
+
+class Button(NamedTuple):
+    text: str = ""
+    icon: str|None = None
+    callback: Callable|None = None
+    style: str = ""
+
+# Field defaults shared by every Config. Values are immutable, so configs
+# reference them and an assignment replaces the reference (copy-on-write).
+_DEFAULTS = (
+    ("MIN_SIZE", Vec2(300, 100)),
+    ("DURATION", 5000),
+    # The countdown stops while the pointer is over the toast
+    ("PAUSE_ON_HOVER", True),
+
+    ("ANIM_SHOW_HIDE_TIME", 500),
+
+    ("USE_ANIM_FADE", True),
+    ("ANIM_FADE_CURVE", CurveType.LINEAR),
+
+    ("POS_OFFSET", Vec2(10, 10)),
+    ("ANIM_POS_OFFSET", Vec2(0, 0)),
+    ("ANIM_POS_CURVE", CurveType.LINEAR),
+
+    ("SHOW_POS", ShowPosType.BOTTOM_RIGHT),
+    # NAMED uses the screen whose QScreen.name() is SCREEN_NAME, falling back to the primary screen
+    ("SHOW_SCREEN", ShowScreenType.PRIMARY),
+    ("SCREEN_NAME", ""),
+
+    ("CONTENT_SPACE", 20),
+
+    ("BG_COLOR", Color(79, 79, 79, 255)),
+    ("FG_COLOR", Color(242, 242, 242)),
+    ("IMAGE_SIZE", Vec2(100, 100)),
+    ("IMAGE_ALIGN", ImageAlign.LEFT),
+    ("TEXT_ALIGN", TextAlign.LEFT),
+    # 0 lets the text grow, otherwise the title and app name are elided and the message wrapped to this width
+    ("TEXT_MAX_WIDTH", 0),
+    ("DRAG_SUPPORT", False),
+    ("IMAGE", ""),
+    ("IMAGE_CROP", ImageCrop.CIRCLE),
+    ("SOUND", ""),
+    ("TITLE", ""),
+    ("MESSAGE", ""),
+    ("APP_NAME", ""),
+    # None hides the progress bar, 0-100 is a percentage, a negative value is a busy indicator
+    ("PROGRESS", None),
+    # Select actions with at least this many options get a search box, 0 turns it off
+    ("SELECT_FILTER_MIN", 50),
+
+    ("TITLE_FONT_SIZE", 14),
+    ("TITLE_STYLE", ""),
+    ("MESSAGE_FONT_SIZE", 12),
+    ("MESSAGE_STYLE", ""),
+    ("APP_NAME_FONT_SIZE", 10),
+    ("APP_NAME_STYLE", ""),
+    # Name of a theme registered with themeManager(), "" follows the current theme
+    ("THEME", ""),
+
+    ("USE_BLUR_BG", False),
+    ("USE_ACRILIC", False),
+    ("IS_BLUR_DARK", True),
+)
+_FIELDS = tuple(name for name, _ in _DEFAULTS)
+
+class Config:
+    __slots__ = _FIELDS + ("_actions", "_buttons")
+
+    def __init__(self, base: "Config|None" = None, **overrides):
+        # base is a theme, its values are shared rather than copied
+        setter = object.__setattr__
+        if base is None:
+            for name, value in _DEFAULTS:
+                setter(self, name, value)
+            self._actions = None
+            self._buttons = None
+        else:
+            for name in _FIELDS:
+                setter(self, name, getattr(base, name))
+            self._actions = dict(base._actions) if base._actions else None
+            self._buttons = dict(base._buttons) if base._buttons else None
+        for name, value in overrides.items():
+            setattr(self, name, value)
+
+    # ACTIONS and BUTTONS dicts are only allocated when a toast uses them
+    @property
+    def ACTIONS(self) -> dict:
+        if self._actions is None:
+            self._actions = dict()
+        return self._actions
+
+    @ACTIONS.setter
+    def ACTIONS(self, data: dict):
+        self._actions = data
+
+    @property
+    def BUTTONS(self) -> dict:
+        if self._buttons is None:
+            self._buttons = dict()
+        return self._buttons
+
+    @BUTTONS.setter
+    def BUTTONS(self, data: dict):
+        self._buttons = data
+
+    def hasActions(self) -> bool:
+        return bool(self._actions)
+
+    def hasButtons(self) -> bool:
+        return bool(self._buttons)
+
+    def copy(self, **overrides) -> "Config":
+        return Config(self, **overrides)
+
+    def toDict(self, full: bool = False) -> dict:
+        # Only fields that differ from the defaults unless full is set
+        data = dict()
+        for name, default in _DEFAULTS:
+            value = getattr(self, name)
+            if not full and value is default:
+                continue
+            encode = _ENCODERS.get(name)
+            data[name] = encode(value) if encode is not None else value
+        if self._buttons or full:
+            data["BUTTONS"] = {key: [b.text, b.icon, b.style] for key, b in self.BUTTONS.items()}
+        if self._actions or full:
+            data["ACTIONS"] = {key: [a.type.name, a.help, list(a.options), a.style] for key, a in self.ACTIONS.items()}
+        return data
+
+    @staticmethod
+    def fromDict(data: dict, base: "Config|None" = None) -> "Config":
+        config = Config(base)
+        setter = object.__setattr__
+        # Values come from other processes, a wrong type raises TypeError here instead of when the toast is shown
+        for name, value in data.items():
+            decode = _DECODERS.get(name)
+            if decode is not None:
+                setter(config, name, decode(name, value))
+            elif name in _FIELD_SET:
+                setter(config, name, _checkType(name, value, _TYPES[name]))
+            elif name == "BUTTONS":
+                config._buttons = {key: _decodeButton(b) for key, b in _checkType(name, value, (dict,)).items()}
+            elif name == "ACTIONS":
+                config._actions = {key: _decodeAction(a) for key, a in _checkType(name, value, (dict,)).items()}
+        return config
+
+    def toJson(self) -> str:
+        data = self.toDict()
+        image = data.get("IMAGE")
+        if isinstance(image, bytes):
+            data["IMAGE"] = {"base64": base64.b64encode(image).decode("ascii")}
+        return json.dumps(data, separators=(",", ":"))
+
+    @staticmethod
+    def fromJson(text: str|bytes, base: "Config|None" = None) -> "Config":
+        return Config.fromDict(json.loads(text), base)
+
+    def toMsgpack(self) -> bytes:
+        import msgpack
+        return msgpack.packb(self.toDict(), use_bin_type=True)
+
+    @staticmethod
+    def fromMsgpack(data: bytes, base: "Config|None" = None) -> "Config":
+        import msgpack
+        return Config.fromDict(msgpack.unpackb(data, raw=False), base)
+
+_FIELD_SET = frozenset(_FIELDS)
+_CURVE_NAMES = {value: name for name, value in vars(CurveType).items() if not name.startswith("_")}
+
+def _encodeImage(value):
+    if isinstance(value, (str, bytes)):
+        return value
+    if isinstance(value, bytearray):
+        return bytes(value)
+    # QImage, shipped as PNG
+    data = QtCore.QByteArray()
+    buffer = QtCore.QBuffer(data)
+    buffer.open(QtCore.QIODevice.WriteOnly)
+    value.save(buffer, "PNG")
+    return bytes(data)
+
+def _checkType(name: str, value, types: tuple):
+    # Exact types, a bool is not accepted for an int field
+    if type(value) not in types:
+        raise TypeError("%s must be %s, not %s" % (name, " or ".join(t.__name__ for t in types), type(value).__name__))
+    return value
+
+def _decodeImage(name: str, value):
+    # JSON carries image bytes as {"base64": ...}
+    if isinstance(value, dict):
+        return base64.b64decode(_checkType(name, value.get("base64"), (str, bytes)))
+    return _checkType(name, value, (str, bytes))
+
+def _decodeInts(cls):
+    def decode(name: str, value):
+        if type(value) not in (list, tuple) or len(value) > len(cls._fields) or any(type(v) is not int for v in value):
+            raise TypeError("%s must be a list of at most %d ints" % (name, len(cls._fields)))
+        return cls(*value)
+    return decode
+
+def _decodeName(name: str, value, members: dict):
+    member = members.get(_checkType(name, value, (str,)))
+    if member is None:
+        raise ValueError("%s must be one of %s, not %r" % (name, ", ".join(members), value))
+    return member
+
+def _decodeEnum(cls):
+    return lambda name, value: _decodeName(name, value, cls.__members__)
+
+def _decodeCurve(name: str, value):
+    return _decodeName(name, value, _CURVES)
+
+def _decodeButton(data) -> Button:
+    if isinstance(data, dict):
+        data = (data.get("text", ""), data.get("icon"), data.get("style", ""))
+    text, icon, style = _checkType("BUTTONS", data, (list, tuple))
+    return Button(_checkType("BUTTONS text", text, (str,)), _checkType("BUTTONS icon", icon, (str, type(None))), None,
+                  _checkType("BUTTONS style", style, (str,)))
+
+def _decodeAction(data) -> Action:
+    if isinstance(data, dict):
+        data = (data.get("type", "TEXT"), data.get("help", ""), data.get("options", ()), data.get("style", ""))
+    atype, helpText, options, style = _checkType("ACTIONS", data, (list, tuple))
+    options = tuple(_checkType("ACTIONS options", option, (str,)) for option in _checkType("ACTIONS options", options, (list, tuple)))
+    return Action(_decodeEnum(ActionType)("ACTIONS type", atype), _checkType("ACTIONS help", helpText, (str,)), options, None,
+                  _checkType("ACTIONS style", style, (str,)))
+
+_ENCODERS = {
+    "MIN_SIZE": list, "POS_OFFSET": list, "ANIM_POS_OFFSET": list, "IMAGE_SIZE": list,
+    "BG_COLOR": list, "FG_COLOR": list,
+    "ANIM_FADE_CURVE": lambda v: _CURVE_NAMES.get(v, "LINEAR"),
+    "ANIM_POS_CURVE": lambda v: _CURVE_NAMES.get(v, "LINEAR"),
+    "SHOW_POS": lambda v: v.name, "IMAGE_ALIGN": lambda v: v.name, "SHOW_SCREEN": lambda v: v.name,
+    "TEXT_ALIGN": lambda v: v.name, "IMAGE_CROP": lambda v: v.name,
+    "IMAGE": _encodeImage,
+}
+
+_CURVES = {name: value for value, name in _CURVE_NAMES.items()}
+
+_DECODERS = {
+    "MIN_SIZE": _decodeInts(Vec2), "POS_OFFSET": _decodeInts(Vec2),
+    "ANIM_POS_OFFSET": _decodeInts(Vec2), "IMAGE_SIZE": _decodeInts(Vec2),
+    "BG_COLOR": _decodeInts(Color), "FG_COLOR": _decodeInts(Color),
+    "ANIM_FADE_CURVE": _decodeCurve, "ANIM_POS_CURVE": _decodeCurve,
+    "SHOW_POS": _decodeEnum(ShowPosType), "IMAGE_ALIGN": _decodeEnum(ImageAlign), "SHOW_SCREEN": _decodeEnum(ShowScreenType),
+    "TEXT_ALIGN": _decodeEnum(TextAlign), "IMAGE_CROP": _decodeEnum(ImageCrop),
+    "IMAGE": _decodeImage,
+}
+
+# Types accepted for the remaining fields, those of their defaults
+_TYPES = {name: (type(value),) for name, value in _DEFAULTS if name not in _DECODERS}
+_TYPES["PROGRESS"] = (int, type(None))
@@ -0,0 +1,87 @@
+from PyQt5 import QtCore, QtNetwork
+
+from . import client
+from .config import Config
+from .dispatcher import ToastDispatcher
+
+class ToastDaemon(QtCore.QObject):
+    def __init__(self, path: str|None = None, dispatcher: ToastDispatcher|None = None, parent: QtCore.QObject|None = None):
+        super(ToastDaemon, self).__init__(parent)
+        self.path = path if path is not None else client.defaultSocketPath()
+        self.dispatcher = dispatcher if dispatcher is not None else ToastDispatcher(parent=self)
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._onConnection)
+        self._clients = set()
+
+    #------PRIVATES------
+
+    def _onConnection(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            # Keep the wrapper alive, otherwise its slot connections are collected with it
+            self._clients.add(sock)
+            sock.readyRead.connect(lambda s=sock: self._onReadyRead(s))
+            sock.disconnected.connect(lambda s=sock: self._onDisconnected(s))
+
+    def _onDisconnected(self, sock: QtNetwork.QLocalSocket):
+        self._clients.discard(sock)
+        sock.deleteLater()
+
+    def _send(self, sock: QtNetwork.QLocalSocket, message: dict):
+        try:
+            if sock.state() != QtNetwork.QLocalSocket.ConnectedState:
+                return
+        except RuntimeError:
+            # The client went away and the socket was deleted
+            return
+        sock.write(client.encode(message))
+        sock.flush()
+
+    def _onReadyRead(self, sock: QtNetwork.QLocalSocket):
+        while sock.canReadLine():
+            line = bytes(sock.readLine())
+            message = None
+            try:
+                message = client.decode(line)
+                self._handle(sock, message)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                msgId = message.get("id") if isinstance(message, dict) else None
+                self._send(sock, {"id": msgId, "event": "error", "error": str(e)})
+
+    def _handle(self, sock: QtNetwork.QLocalSocket, message: dict):
+        msgId = message.get("id")
+        # Everything is checked before the dispatcher sees it, a bad field is answered with an error event
+        config = Config.fromDict(message["config"])
+        priority = message.get("priority", 0)
+        msgKey = message.get("key")
+        if type(priority) is not int:
+            raise TypeError("priority must be int, not %s" % type(priority).__name__)
+        if msgKey is not None and type(msgKey) is not str:
+            raise TypeError("key must be str, not %s" % type(msgKey).__name__)
+        # Callbacks are routed back to the client as events
+        if config.hasButtons():
+            config.BUTTONS = {key: button._replace(callback=lambda checked=False, k=key: self._send(sock, {"id": msgId, "event": "button", "name": k}))
+                              for key, button in config.BUTTONS.items()}
+        if config.hasActions():
+            config.ACTIONS = {key: action._replace(callback=lambda value, k=key: self._send(sock, {"id": msgId, "event": "action", "name": k, "value": value}))
+                              for key, action in config.ACTIONS.items()}
+        onDone = lambda reason: self._send(sock, {"id": msgId, "event": reason})
+        self.dispatcher.notify(config, priority, msgKey, onDone)
+
+    #------PUBLIC------
+
+    def listen(self):
+        # Raises OSError when another daemon answers on the path, only a stale socket file is removed
+        client.requireUnixSockets()
+        probe = QtNetwork.QLocalSocket()
+        probe.connectToServer(self.path)
+        if probe.waitForConnected(200):
+            probe.disconnectFromServer()
+            raise OSError("a notification daemon is already listening on %s" % self.path)
+        QtNetwork.QLocalServer.removeServer(self.path)
+        if not self._server.listen(self.path):
+            raise OSError(self._server.errorString())
+
+    def close(self):
+        self._server.close()
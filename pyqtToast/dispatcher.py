@@ -0,0 +1,186 @@
+from PyQt5 import QtCore
+import sys
+import time
+import heapq
+
+from .config import Config
+from .toast import Toast
+from .pool import ToastPool
+from .stack import ToastStack
+from .driver import AnimationDriver
+from .history import ToastHistory
+
+class _QueuedToast:
+    def __init__(self, config: Config, priority: int, key: str|None, onDone = None):
+        self.config = config
+        self.onDone = onDone
+        self.priority = priority
+        self.key = key
+        self.title = config.TITLE
+        self.count = 1
+        self.toast = None
+
+    def done(self, reason: str):
+        if self.onDone is not None:
+            self.onDone(reason)
+
+    def titleWithCount(self):
+        if self.count > 1:
+            return "%s (x%d)" % (self.title, self.count)
+        return self.title
+
+class ToastDispatcher(QtCore.QObject):
+    def __init__(self, maxVisible: int = 5, rate: float = 2.0, burst: int = 5, maxQueue: int = 100, pool: ToastPool|None = None, stack: ToastStack|None = None, driver: AnimationDriver|None = None, history: ToastHistory|None = None, parent: QtCore.QObject|None = None):
+        super(ToastDispatcher, self).__init__(parent)
+        self.maxVisible = maxVisible
+        self.rate = rate
+        self.burst = burst
+        self.maxQueue = maxQueue
+        self.pool = pool if pool is not None else ToastPool(maxVisible)
+        self.stack = stack if stack is not None else ToastStack(parent=self)
+        self.driver = driver
+        self.history = history
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._queue = []
+        self._seq = 0
+        self._pending = dict()
+        self._visible = dict()
+        self._shown = dict()
+        self._suppressed = 0
+        self._summary = None
+
+        self._tokens = float(burst)
+        self._lastRefill = time.monotonic()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._drain)
+
+    #------PRIVATES------
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._lastRefill) * self.rate)
+        self._lastRefill = now
+
+    def _coalesce(self, key: str):
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = self._visible.get(key)
+            if entry is None:
+                return False
+            if entry.toast._isHiding():
+                # A hiding toast can not be updated any more, the duplicate is shown as a new toast
+                del self._visible[key]
+                return False
+            entry.count += 1
+            entry.toast.update(entry.toast.config.copy(TITLE=entry.titleWithCount()), restartTimer=True)
+        else:
+            entry.count += 1
+        self.coalesced += 1
+        return True
+
+    def _dropLowest(self):
+        # Overflow drops the newest of the lowest priority entries
+        item = max(self._queue)
+        self._queue.remove(item)
+        heapq.heapify(self._queue)
+        entry = item[2]
+        if entry.key is not None:
+            self._pending.pop(entry.key, None)
+        self.dropped += entry.count
+        self._suppressed += entry.count
+        entry.done("dropped")
+
+    def _onHidden(self, toast: Toast):
+        entry = self._shown.pop(toast, None)
+        if entry is not None:
+            if entry.key is not None and self._visible.get(entry.key) is entry:
+                del self._visible[entry.key]
+            entry.done("hidden")
+        if toast is self._summary:
+            self._summary = None
+        self._drain()
+
+    def _showToast(self, config: Config, entry: _QueuedToast|None = None):
+        toast = self.pool.acquire(config)
+        if getattr(toast, "_dispatcher", None) is not self:
+            toast._dispatcher = self
+            toast.popuphidden.connect(lambda t=toast: self._onHidden(t))
+        if self.driver is not None and toast._driver is not self.driver:
+            toast.setAnimationDriver(self.driver)
+        if self.history is not None:
+            toast.setHistory(self.history)
+        self.stack.add(toast)
+        self._shown[toast] = entry
+        try:
+            toast.show()
+        except Exception:
+            # A toast that failed half way would keep its visible slot and its place in the stack
+            del self._shown[toast]
+            toast._hide(True)
+            raise
+        return toast
+
+    def _showSummary(self):
+        config = Config()
+        config.TITLE = "%d more notifications" % self._suppressed
+        config.MESSAGE = "Suppressed during a burst"
+        self._suppressed = 0
+        self._summary = self._showToast(config)
+
+    def _drain(self):
+        self._refill()
+        while len(self._queue) > 0 and len(self._shown) < self.maxVisible:
+            if self._tokens < 1.0:
+                self._timer.start(int((1.0 - self._tokens) / self.rate * 1000) + 1)
+                return
+            self._tokens -= 1.0
+            _, _, entry = heapq.heappop(self._queue)
+            if entry.key is not None:
+                self._pending.pop(entry.key, None)
+            # The caller's config is left untouched, a coalesced entry shows a copy with the count
+            config = entry.config if entry.count == 1 else entry.config.copy(TITLE=entry.titleWithCount())
+            try:
+                entry.toast = self._showToast(config, entry)
+            except Exception:
+                # Reported without ending the drain, it often runs from the timer where an exception aborts PyQt
+                sys.excepthook(*sys.exc_info())
+                entry.done("error")
+                continue
+            if entry.key is not None:
+                self._visible[entry.key] = entry
+        if len(self._queue) == 0 and self._suppressed > 0 and self._summary is None and len(self._shown) < self.maxVisible:
+            self._showSummary()
+
+    #------PUBLIC------
+
+    def notify(self, config: Config, priority: int = 0, key: str|None = None, onDone = None):
+        # onDone is called with "hidden", "coalesced", "dropped" or "error" once the notification is finished
+        if key is not None and self._coalesce(key):
+            if onDone is not None:
+                onDone("coalesced")
+            return
+        entry = _QueuedToast(config, priority, key, onDone)
+        heapq.heappush(self._queue, (-priority, self._seq, entry))
+        self._seq += 1
+        if key is not None:
+            self._pending[key] = entry
+        if len(self._queue) > self.maxQueue:
+            self._dropLowest()
+        self._drain()
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def visible(self) -> int:
+        return len(self._shown)
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self._queue),
+            "visible": len(self._shown),
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,132 @@
+from PyQt5 import QtCore
+import time
+
+from .expiry import expiryScheduler
+
+class _Track:
+    def __init__(self, start: float, duration: float, begin, end, curve: QtCore.QEasingCurve, onFinished = None):
+        self.start = start
+        self.duration = duration
+        self.begin = begin
+        self.end = end
+        self.curve = curve
+        self.onFinished = onFinished
+
+    def value(self, now: float):
+        progress = 1.0 if self.duration <= 0 else min(1.0, (now - self.start) / self.duration)
+        return self.curve.valueForProgress(progress), progress >= 1.0
+
+class AnimationDriver(QtCore.QObject):
+    def __init__(self, fps: int = 60, parent: QtCore.QObject|None = None):
+        # One timer drives the fade/slide animations of every toast attached to it
+        super(AnimationDriver, self).__init__(parent)
+        self.interval = max(1, int(1000 / fps))
+        self._opacity = dict()
+        self._pos = dict()
+        self._curves = dict()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+
+        self.frames = 0
+        self._frameTotal = 0.0
+        self._frameMax = 0.0
+        self._lastTick = None
+        self._intervalTotal = 0.0
+        self._intervalMax = 0.0
+        self._intervals = 0
+
+    #------PRIVATES------
+
+    def _curve(self, curveType):
+        curve = self._curves.get(curveType)
+        if curve is None:
+            curve = QtCore.QEasingCurve(curveType)
+            self._curves[curveType] = curve
+        return curve
+
+    def _reschedule(self):
+        if len(self._opacity) > 0 or len(self._pos) > 0:
+            if not self._timer.isActive() or self._timer.remainingTime() > self.interval:
+                self._timer.start(self.interval)
+            return
+        self._lastTick = None
+        self._timer.stop()
+
+    def _tick(self):
+        begin = time.monotonic()
+        animating = len(self._opacity) > 0 or len(self._pos) > 0
+        if animating and self._lastTick is not None:
+            interval = begin - self._lastTick
+            self._intervalTotal += interval
+            self._intervalMax = max(self._intervalMax, interval)
+            self._intervals += 1
+        self._lastTick = begin if animating else None
+
+        finished = []
+        for toast, track in list(self._pos.items()):
+            k, done = track.value(begin)
+            x = track.begin.x() + (track.end.x() - track.begin.x()) * k
+            y = track.begin.y() + (track.end.y() - track.begin.y()) * k
+            toast.move(int(round(x)), int(round(y)))
+            if done:
+                del self._pos[toast]
+        for toast, track in list(self._opacity.items()):
+            k, done = track.value(begin)
+            toast.setWindowOpacity(track.begin + (track.end - track.begin) * k)
+            if done:
+                del self._opacity[toast]
+                if track.onFinished is not None:
+                    finished.append(track.onFinished)
+
+        if animating:
+            elapsed = time.monotonic() - begin
+            self.frames += 1
+            self._frameTotal += elapsed
+            self._frameMax = max(self._frameMax, elapsed)
+
+        for callback in finished:
+            callback()
+        self._reschedule()
+
+    #------PUBLIC------
+
+    def animate(self, toast, duration: int, opacity: tuple|None = None, pos: tuple|None = None, fadeCurve = QtCore.QEasingCurve.Linear, posCurve = QtCore.QEasingCurve.Linear, onFinished = None):
+        now = time.monotonic()
+        if opacity is not None:
+            self._opacity[toast] = _Track(now, duration / 1000, opacity[0], opacity[1], self._curve(fadeCurve), onFinished)
+            toast.setWindowOpacity(opacity[0])
+        if pos is not None:
+            self._pos[toast] = _Track(now, duration / 1000, pos[0], pos[1], self._curve(posCurve))
+            toast.move(pos[0])
+        self._reschedule()
+
+    def cancel(self, toast):
+        self._opacity.pop(toast, None)
+        self._pos.pop(toast, None)
+
+    def active(self) -> int:
+        return len(set(self._opacity) | set(self._pos))
+
+    def stats(self) -> dict:
+        meanInterval = self._intervalTotal / self._intervals if self._intervals > 0 else 0.0
+        return {
+            "frames": self.frames,
+            "frame_mean_ms": self._frameTotal / self.frames * 1000 if self.frames > 0 else 0.0,
+            "frame_max_ms": self._frameMax * 1000,
+            "interval_mean_ms": meanInterval * 1000,
+            "interval_max_ms": self._intervalMax * 1000,
+            "fps": 1.0 / meanInterval if meanInterval > 0 else 0.0,
+            "animating": self.active(),
+            "pending_expiries": expiryScheduler().pending(),
+        }
+
+    def resetStats(self):
+        self.frames = 0
+        self._frameTotal = 0.0
+        self._frameMax = 0.0
+        self._intervalTotal = 0.0
+        self._intervalMax = 0.0
+        self._intervals = 0
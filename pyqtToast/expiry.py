@@ -0,0 +1,241 @@
+from PyQt5 import QtCore, QtGui
+import time
+import heapq
+
+# Events that count as user activity for idle detection
+_INPUT_EVENTS = frozenset((
+    QtCore.QEvent.MouseMove, QtCore.QEvent.MouseButtonPress, QtCore.QEvent.KeyPress, QtCore.QEvent.Wheel,
+    QtCore.QEvent.TouchBegin, QtCore.QEvent.TabletPress,
+))
+
+class ExpiryScheduler(QtCore.QObject):
+    pausedChanged = QtCore.pyqtSignal(bool)
+
+    def __init__(self, idleMs: int = 60000, parent: QtCore.QObject|None = None):
+        # One timer for the expiry of every toast. Deadlines live in a heap on a clock that stops
+        # while all countdowns are paused (idle, suspended or pauseAll), so resuming keeps their order.
+        # A hovered toast leaves the heap and keeps its remaining time.
+        super(ExpiryScheduler, self).__init__(parent)
+        self.idleMs = 0
+        self.fired = 0
+        self._heap = []
+        self._entries = dict()
+        self._held = set()
+        self._remaining = dict()
+        self._seq = 0
+        self._reasons = set()
+        self._pausedAt = None
+        self._offset = 0.0
+        self._lastActivity = time.monotonic()
+        self._cursor = None
+        self._watching = False
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+        self._idleTimer = QtCore.QTimer(self)
+        self._idleTimer.setSingleShot(True)
+        self._idleTimer.timeout.connect(self._checkIdle)
+
+        app = QtCore.QCoreApplication.instance()
+        if isinstance(app, QtGui.QGuiApplication):
+            app.applicationStateChanged.connect(self._onStateChanged)
+        self.setIdleTimeout(idleMs)
+
+    #------PRIVATES------
+
+    def _clock(self) -> float:
+        now = self._pausedAt if self._pausedAt is not None else time.monotonic()
+        return now - self._offset
+
+    def _push(self, toast, seconds: float):
+        self._seq += 1
+        deadline = self._clock() + seconds
+        self._entries[toast] = (deadline, self._seq)
+        heapq.heappush(self._heap, (deadline, self._seq, toast))
+        if self._heap[0][1] == self._seq:
+            self._arm()
+
+    def _drop(self, toast):
+        # Heap entries are skipped lazily, the heap is rebuilt once most of it is stale
+        entry = self._entries.pop(toast, None)
+        if entry is not None and len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(deadline, seq, t) for t, (deadline, seq) in self._entries.items()]
+            heapq.heapify(self._heap)
+        return entry
+
+    def _arm(self):
+        while len(self._heap) > 0 and self._entries.get(self._heap[0][2], (None, None))[1] != self._heap[0][1]:
+            heapq.heappop(self._heap)
+        if len(self._heap) == 0 or self._pausedAt is not None:
+            self._timer.stop()
+            return
+        delay = (self._heap[0][0] - self._clock()) * 1000
+        self._timer.start(max(0, int(delay) + 1))
+
+    def _fire(self):
+        now = self._clock()
+        due = []
+        while len(self._heap) > 0 and self._heap[0][0] <= now:
+            _, seq, toast = heapq.heappop(self._heap)
+            entry = self._entries.get(toast)
+            if entry is not None and entry[1] == seq:
+                del self._entries[toast]
+                due.append(toast)
+        self._arm()
+        self._watch()
+        self.fired += len(due)
+        for toast in due:
+            try:
+                toast._hideAnimation()
+            except RuntimeError:
+                # The toast was deleted while its expiry was pending
+                pass
+
+    def _pause(self, reason: str):
+        if len(self._reasons) == 0:
+            self._pausedAt = time.monotonic()
+            self._timer.stop()
+            self.pausedChanged.emit(True)
+        self._reasons.add(reason)
+
+    def _resume(self, reason: str):
+        if reason not in self._reasons:
+            return
+        self._reasons.discard(reason)
+        if len(self._reasons) == 0:
+            self._offset += time.monotonic() - self._pausedAt
+            self._pausedAt = None
+            self._arm()
+            self.pausedChanged.emit(False)
+
+    def _watch(self):
+        # The application wide filter costs every event of the host a call into Python,
+        # it is only installed while a countdown is pending
+        active = self.idleMs > 0 and self.pending() > 0
+        if active == self._watching:
+            return
+        self._watching = active
+        app = QtCore.QCoreApplication.instance()
+        if active:
+            # Input before the first countdown was not watched, idle time starts now
+            app.installEventFilter(self)
+            self._cursor = QtGui.QCursor.pos()
+            self._lastActivity = time.monotonic()
+            self._armIdle()
+        else:
+            app.removeEventFilter(self)
+            self._idleTimer.stop()
+            self._resume("idle")
+
+    def _armIdle(self):
+        if self._watching and not self._idleTimer.isActive():
+            self._idleTimer.start(max(1000, int(self.idleMs - (time.monotonic() - self._lastActivity) * 1000)))
+
+    def _checkIdle(self):
+        # Input of other applications is not seen by Qt, a moving cursor still counts as activity
+        cursor = QtGui.QCursor.pos()
+        if cursor != self._cursor:
+            self._cursor = cursor
+            self._activity()
+        elif (time.monotonic() - self._lastActivity) * 1000 >= self.idleMs:
+            self._pause("idle")
+        if "idle" in self._reasons:
+            self._idleTimer.start(1000)
+        else:
+            self._armIdle()
+
+    def _activity(self):
+        self._lastActivity = time.monotonic()
+        if "idle" in self._reasons:
+            self._resume("idle")
+            self._armIdle()
+
+    def _onStateChanged(self, state):
+        if state == QtCore.Qt.ApplicationSuspended:
+            self._pause("suspended")
+        else:
+            self._resume("suspended")
+
+    #------EVENTS------
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() in _INPUT_EVENTS:
+            self._activity()
+        return False
+
+    #------PUBLIC------
+
+    def schedule(self, toast, msec: int):
+        self._drop(toast)
+        if toast in self._held:
+            self._remaining[toast] = msec / 1000
+        else:
+            self._push(toast, msec / 1000)
+        self._watch()
+
+    def unschedule(self, toast):
+        self._drop(toast)
+        self._remaining.pop(toast, None)
+        self._held.discard(toast)
+        self._watch()
+
+    def hold(self, toast):
+        # Stops the countdown of one toast, e.g. while it is hovered
+        self._held.add(toast)
+        entry = self._drop(toast)
+        if entry is not None:
+            self._remaining[toast] = max(0.0, entry[0] - self._clock())
+
+    def release(self, toast):
+        self._held.discard(toast)
+        remaining = self._remaining.pop(toast, None)
+        if remaining is not None:
+            self._push(toast, remaining)
+
+    def pauseAll(self):
+        self._pause("user")
+
+    def resumeAll(self):
+        self._resume("user")
+
+    def isPaused(self) -> bool:
+        return len(self._reasons) > 0
+
+    def remaining(self, toast) -> int|None:
+        # Milliseconds left for toast, None when nothing is scheduled
+        entry = self._entries.get(toast)
+        if entry is not None:
+            return max(0, int((entry[0] - self._clock()) * 1000))
+        remaining = self._remaining.get(toast)
+        return int(remaining * 1000) if remaining is not None else None
+
+    def pending(self) -> int:
+        return len(self._entries) + len(self._remaining)
+
+    def setIdleTimeout(self, msec: int):
+        # 0 turns idle detection off
+        self.idleMs = msec
+        self._idleTimer.stop()
+        self._watch()
+        self._armIdle()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._entries),
+            "held": len(self._remaining),
+            "heap": len(self._heap),
+            "fired": self.fired,
+            "paused": self.isPaused(),
+            "watching": self._watching,
+        }
+
+_expiryScheduler = None
+
+def expiryScheduler() -> ExpiryScheduler:
+    global _expiryScheduler
+    if _expiryScheduler is None:
+        _expiryScheduler = ExpiryScheduler(parent=QtCore.QCoreApplication.instance())
+    return _expiryScheduler
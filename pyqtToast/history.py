@@ -0,0 +1,354 @@
+from PyQt5 import QtCore, QtWidgets
+import time
+import sqlite3
+from collections import OrderedDict
+from typing import NamedTuple
+
+from .config import Config
+
+class HistoryEntry(NamedTuple):
+    id: int
+    shown: float
+    hidden: float|None = None
+    app: str = ""
+    title: str = ""
+    message: str = ""
+    used: str = ""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS history(id INTEGER PRIMARY KEY, shown REAL NOT NULL, hidden REAL, app TEXT, title TEXT, message TEXT, used TEXT)",
+    "CREATE INDEX IF NOT EXISTS history_app ON history(app, shown)",
+    "CREATE INDEX IF NOT EXISTS history_shown ON history(shown)",
+)
+
+# Full text index over title and message, kept in sync by triggers
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS history_text USING fts5(title, message, content='history', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN "
+    "INSERT INTO history_text(rowid, title, message) VALUES (new.id, new.title, new.message); END",
+    "CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN "
+    "INSERT INTO history_text(history_text, rowid, title, message) VALUES ('delete', old.id, old.title, old.message); END",
+    "CREATE TRIGGER IF NOT EXISTS history_au AFTER UPDATE ON history BEGIN "
+    "INSERT INTO history_text(history_text, rowid, title, message) VALUES ('delete', old.id, old.title, old.message); "
+    "INSERT INTO history_text(rowid, title, message) VALUES (new.id, new.title, new.message); END",
+)
+
+_UPSERT = ("INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+           "hidden=excluded.hidden, app=excluded.app, title=excluded.title, message=excluded.message, used=excluded.used")
+
+def _matches(entry: HistoryEntry, app: str|None, since: float|None, until: float|None, text: str|None) -> bool:
+    if app is not None and entry.app != app:
+        return False
+    if since is not None and entry.shown < since:
+        return False
+    if until is not None and entry.shown > until:
+        return False
+    if text:
+        haystack = (entry.title + " " + entry.message).lower()
+        return all(word in haystack for word in text.lower().split())
+    return True
+
+class ToastHistory(QtCore.QObject):
+    recorded = QtCore.pyqtSignal(object)
+    changed = QtCore.pyqtSignal(object)
+
+    def __init__(self, maxEntries: int = 1000, path: str|None = None, flushMs: int = 1000, parent: QtCore.QObject|None = None):
+        # The newest entries stay in memory, with a path every entry is also written to SQLite in batches
+        super(ToastHistory, self).__init__(parent)
+        self.maxEntries = maxEntries
+        self.path = path
+        self._entries = OrderedDict()
+        self._dirty = dict()
+        self._seq = 0
+        self._db = None
+        self._fts = False
+        self.flushErrors = 0
+        self.lastError = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flushMs)
+        self._timer.timeout.connect(self._tryFlush)
+
+        if path is not None:
+            self._open(path)
+
+    #------PRIVATES------
+
+    def _open(self, path: str):
+        self._db = sqlite3.connect(path)
+        # Batched writes from the GUI thread, a commit should not wait for a full fsync
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for sql in _SCHEMA:
+            self._db.execute(sql)
+        try:
+            for sql in _FTS_SCHEMA:
+                self._db.execute(sql)
+            self._fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5, text search falls back to LIKE
+            self._fts = False
+        self._db.commit()
+        self._seq = self._db.execute("SELECT COALESCE(MAX(id), 0) FROM history").fetchone()[0]
+
+    def _store(self, entry: HistoryEntry):
+        self._entries[entry.id] = entry
+        while len(self._entries) > self.maxEntries:
+            self._entries.popitem(last=False)
+        if self._db is not None:
+            self._dirty[entry.id] = entry
+            # After a failed flush only the timer retries
+            if len(self._dirty) >= 256 and self.lastError is None:
+                self._tryFlush()
+            elif not self._timer.isActive():
+                self._timer.start()
+
+    def _tryFlush(self):
+        # Runs from the timer and from record(), a locked or full database must not abort the application.
+        # The entries stay dirty and a later flush writes them.
+        try:
+            self.flush()
+            self.lastError = None
+        except sqlite3.Error as e:
+            self.flushErrors += 1
+            self.lastError = str(e)
+            self._timer.start()
+
+    def _replace(self, id: int, **fields):
+        entry = self._entries.get(id)
+        if entry is None:
+            entry = self._dirty.get(id)
+        if entry is None and self._db is not None:
+            row = self._db.execute("SELECT * FROM history WHERE id = ?", (id,)).fetchone()
+            entry = HistoryEntry(*row) if row is not None else None
+        if entry is None:
+            return
+        entry = entry._replace(**fields)
+        if id in self._entries:
+            self._entries[id] = entry
+        if self._db is not None:
+            self._dirty[id] = entry
+            if not self._timer.isActive():
+                self._timer.start()
+        self.changed.emit(entry)
+
+    def _query(self, app, since, until, text, limit, beforeId):
+        where, args = [], []
+        if app is not None:
+            where.append("app = ?")
+            args.append(app)
+        if since is not None:
+            where.append("shown >= ?")
+            args.append(since)
+        if until is not None:
+            where.append("shown <= ?")
+            args.append(until)
+        if beforeId is not None:
+            where.append("id < ?")
+            args.append(beforeId)
+        if text:
+            if self._fts:
+                where.append("id IN (SELECT rowid FROM history_text WHERE history_text MATCH ?)")
+                args.append(" ".join('"%s"*' % word.replace('"', '""') for word in text.split()))
+            else:
+                for word in text.split():
+                    where.append("(title LIKE ? OR message LIKE ?)")
+                    args += ["%" + word + "%"] * 2
+        sql = "SELECT * FROM history"
+        if len(where) > 0:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC LIMIT ?"
+        args.append(limit)
+        return [HistoryEntry(*row) for row in self._db.execute(sql, args)]
+
+    #------PUBLIC------
+
+    def record(self, config: Config) -> int:
+        self._seq += 1
+        entry = HistoryEntry(self._seq, time.time(), None, config.APP_NAME, config.TITLE, config.MESSAGE)
+        self._store(entry)
+        self.recorded.emit(entry)
+        return entry.id
+
+    def update(self, id: int, config: Config):
+        self._replace(id, app=config.APP_NAME, title=config.TITLE, message=config.MESSAGE)
+
+    def markHidden(self, id: int):
+        self._replace(id, hidden=time.time())
+
+    def markUsed(self, id: int, name: str, value: str|None = None):
+        self._replace(id, used=name if value is None else "%s=%s" % (name, value))
+
+    def get(self, id: int) -> HistoryEntry|None:
+        entry = self._entries.get(id)
+        if entry is not None or self._db is None:
+            return entry
+        self.flush()
+        row = self._db.execute("SELECT * FROM history WHERE id = ?", (id,)).fetchone()
+        return HistoryEntry(*row) if row is not None else None
+
+    def search(self, app: str|None = None, since: float|None = None, until: float|None = None, text: str|None = None,
+               limit: int = 100, beforeId: int|None = None) -> list:
+        # Newest first; beforeId pages through older results
+        if self._db is not None:
+            self.flush()
+            return self._query(app, since, until, text, limit, beforeId)
+        result = []
+        for entry in reversed(self._entries.values()):
+            if beforeId is not None and entry.id >= beforeId:
+                continue
+            if _matches(entry, app, since, until, text):
+                result.append(entry)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def count(self) -> int:
+        if self._db is not None:
+            self.flush()
+            return self._db.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        return len(self._entries)
+
+    def flush(self):
+        self._timer.stop()
+        if self._db is None or len(self._dirty) == 0:
+            return
+        with self._db:
+            self._db.executemany(_UPSERT, self._dirty.values())
+        self._dirty.clear()
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty.clear()
+        if self._db is not None:
+            with self._db:
+                self._db.execute("DELETE FROM history")
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def stats(self) -> dict:
+        return {
+            "memory": len(self._entries),
+            "pending": len(self._dirty),
+            "last_id": self._seq,
+            "fts": self._fts,
+            "flush_errors": self.flushErrors,
+        }
+
+class HistoryModel(QtCore.QAbstractListModel):
+    EntryRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, history: ToastHistory, pageSize: int = 500, parent: QtCore.QObject|None = None):
+        # Rows are fetched a page at a time as the view scrolls, newest first
+        super(HistoryModel, self).__init__(parent)
+        self.history = history
+        self.pageSize = pageSize
+        self._rows = []
+        self._filter = (None, None)
+        self._atEnd = False
+        history.recorded.connect(self._onRecorded)
+        history.changed.connect(self._onChanged)
+
+    #------PRIVATES------
+
+    def _row(self, id: int) -> int:
+        # Rows are sorted by descending id
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._rows[mid].id > id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._rows) and self._rows[lo].id == id:
+            return lo
+        return -1
+
+    def _onRecorded(self, entry: HistoryEntry):
+        if not _matches(entry, self._filter[0], None, None, self._filter[1]):
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
+        self._rows.insert(0, entry)
+        self.endInsertRows()
+
+    def _onChanged(self, entry: HistoryEntry):
+        row = self._row(entry.id)
+        if row >= 0:
+            self._rows[row] = entry
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    #------PUBLIC------
+
+    def setFilter(self, app: str|None = None, text: str|None = None):
+        self.beginResetModel()
+        self._filter = (app, text or None)
+        self._rows = []
+        self._atEnd = False
+        self.endResetModel()
+        self.fetchMore(QtCore.QModelIndex())
+
+    def rowCount(self, parent = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def canFetchMore(self, parent) -> bool:
+        return not parent.isValid() and not self._atEnd
+
+    def fetchMore(self, parent):
+        beforeId = self._rows[-1].id if len(self._rows) > 0 else None
+        page = self.history.search(self._filter[0], text=self._filter[1], limit=self.pageSize, beforeId=beforeId)
+        if len(page) < self.pageSize:
+            self._atEnd = True
+        if len(page) == 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), len(self._rows), len(self._rows) + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def data(self, index, role = QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        entry = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            text = time.strftime("%H:%M:%S", time.localtime(entry.shown))
+            if entry.app != "":
+                text += "  [%s]" % entry.app
+            text += "  " + entry.title
+            if entry.message != "":
+                text += " - " + entry.message.replace("\n", " ")
+            return text
+        if role == QtCore.Qt.ToolTipRole:
+            return entry.message
+        if role == self.EntryRole:
+            return entry
+        return None
+
+class HistoryPanel(QtWidgets.QWidget):
+    def __init__(self, history: ToastHistory, parent: QtWidgets.QWidget|None = None):
+        super(HistoryPanel, self).__init__(parent)
+        self.model = HistoryModel(history, parent=self)
+
+        self._filter = QtWidgets.QLineEdit(self)
+        self._filter.setPlaceholderText("Search")
+        self._filter.setClearButtonEnabled(True)
+
+        # Uniform rows let the view skip measuring every item
+        self._view = QtWidgets.QListView(self)
+        self._view.setUniformItemSizes(True)
+        self._view.setLayoutMode(QtWidgets.QListView.Batched)
+        self._view.setModel(self.model)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self._filter)
+        layout.addWidget(self._view)
+
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(200)
+        self._debounce.timeout.connect(lambda: self.model.setFilter(text=self._filter.text()))
+        self._filter.textChanged.connect(self._debounce.start)
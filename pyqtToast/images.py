@@ -0,0 +1,243 @@
+from PyQt5 import QtCore, QtGui
+import os
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from .config import ImageCrop, Vec2
+
+def _maskQImage(image: QtGui.QImage, size: int = 100, pr: float = 1.0) -> QtGui.QImage:
+    # Only QImage work, so it is safe on a worker thread
+    image = image.convertToFormat(QtGui.QImage.Format_ARGB32)
+
+    # Crop image to a square:
+    imgsize = min(image.width(), image.height())
+    rect = QtCore.QRect(
+        int((image.width() - imgsize) / 2),
+        int((image.height() - imgsize) / 2),
+        imgsize,
+        imgsize,
+     ) 
+
+    image = image.copy(rect)
+    out_img = QtGui.QImage(imgsize, imgsize, QtGui.QImage.Format_ARGB32)
+    out_img.fill(QtCore.Qt.transparent)
+    brush = QtGui.QBrush(image)
+
+    # Paint the output image
+    painter = QtGui.QPainter(out_img)
+    painter.setBrush(brush)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.drawEllipse(0, 0, imgsize, imgsize)
+    painter.end()
+
+    # Rescale for the device pixel ratio
+    size *= pr
+    out_img = out_img.scaled(int(size), int(size), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+    out_img.setDevicePixelRatio(pr)
+    return out_img
+
+def _maskImage(imgdata, imgtype: str ='png', size: int = 100, pr: float = 1.0):
+    image = QtGui.QImage.fromData(imgdata, imgtype)
+    return QtGui.QPixmap.fromImage(_maskQImage(image, size, pr))
+
+def _readImage(source) -> QtGui.QImage:
+    if isinstance(source, QtGui.QImage):
+        return source
+    if isinstance(source, (bytes, bytearray)):
+        return QtGui.QImage.fromData(bytes(source))
+    return QtGui.QImage(source)
+
+def _loadImage(source, crop: ImageCrop, size: Vec2, pr: float) -> QtGui.QImage:
+    image = _readImage(source)
+    if image.isNull():
+        return image
+    if crop == ImageCrop.CIRCLE:
+        return _maskQImage(image, size.x, pr)
+    return image.scaled(size.x, size.y)
+
+def hasImage(source) -> bool:
+    if isinstance(source, QtGui.QImage):
+        return not source.isNull()
+    return source is not None and len(source) > 0
+
+class PixmapCache:
+    def __init__(self, maxBytes: int = 32 * 1024 * 1024):
+        self.maxBytes = maxBytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+
+    #------PRIVATES------
+
+    def _load(self, source, crop: ImageCrop, size: Vec2, pr: float):
+        return QtGui.QPixmap.fromImage(_loadImage(source, crop, size, pr))
+
+    def _pixmapBytes(self, pixmap: QtGui.QPixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def _evict(self):
+        while self.bytes > self.maxBytes and len(self._items) > 0:
+            _, (_, size) = self._items.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    #------PUBLIC------
+
+    def key(self, source, crop: ImageCrop, size: Vec2, pr: float):
+        # source is a file path, encoded image bytes or a QImage
+        if isinstance(source, QtGui.QImage):
+            ident = ("qimage", source.cacheKey())
+        elif isinstance(source, (bytes, bytearray)):
+            ident = ("bytes", hash(bytes(source)))
+        else:
+            try:
+                ident = (source, os.stat(source).st_mtime_ns)
+            except OSError:
+                ident = (source, 0)
+        return (ident, crop, size.x, size.y, pr)
+
+    def lookup(self, key) -> QtGui.QPixmap|None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return item[0]
+
+    def insert(self, key, pixmap: QtGui.QPixmap):
+        nbytes = self._pixmapBytes(pixmap)
+        if nbytes <= self.maxBytes and key not in self._items:
+            self._items[key] = (pixmap, nbytes)
+            self.bytes += nbytes
+            self._evict()
+
+    def get(self, source, crop: ImageCrop = ImageCrop.CIRCLE, size: Vec2 = Vec2(100, 100), pr: float = 1.0) -> QtGui.QPixmap:
+        return self.cached(self.key(source, crop, size, pr), lambda: self._load(source, crop, size, pr))
+
+    def cached(self, key, factory) -> QtGui.QPixmap:
+        pixmap = self.lookup(key)
+        if pixmap is not None:
+            return pixmap
+        self.misses += 1
+        pixmap = factory()
+        self.insert(key, pixmap)
+        return pixmap
+
+    def preload(self, paths: Sequence[str], crop: ImageCrop = ImageCrop.CIRCLE, size: Vec2 = Vec2(100, 100), pr: float|None = None, background: bool = False):
+        if pr is None:
+            pr = QtGui.QGuiApplication.primaryScreen().devicePixelRatio()
+        for path in paths:
+            if background:
+                imageLoader().load(path, crop, size, pr)
+            else:
+                self.get(path, crop, size, pr)
+
+    def setMaxBytes(self, data: int):
+        self.maxBytes = data
+        self._evict()
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._items),
+            "bytes": self.bytes,
+            "maxBytes": self.maxBytes,
+        }
+
+pixmapCache = PixmapCache()
+
+class _ImageTask(QtCore.QRunnable):
+    def __init__(self, loader: "ImageLoader", key, source, crop: ImageCrop, size: Vec2, pr: float):
+        super(_ImageTask, self).__init__()
+        self._loader = loader
+        self._key = key
+        self._source = source
+        self._crop = crop
+        self._size = size
+        self._pr = pr
+
+    def run(self):
+        image = _loadImage(self._source, self._crop, self._size, self._pr)
+        # Queued to the GUI thread, the loader lives there
+        self._loader._done.emit(self._key, image)
+
+class ImageLoader(QtCore.QObject):
+    _done = QtCore.pyqtSignal(object, QtGui.QImage)
+
+    def __init__(self, maxThreads: int = 2, cache: PixmapCache|None = None, parent: QtCore.QObject|None = None):
+        super(ImageLoader, self).__init__(parent)
+        self.cache = cache if cache is not None else pixmapCache
+        self.failed = 0
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(maxThreads)
+        self._waiting = dict()
+        self._done.connect(self._onDone)
+
+    #------PRIVATES------
+
+    def _onDone(self, key, image: QtGui.QImage):
+        callbacks = self._waiting.pop(key, [])
+        if image.isNull():
+            self.failed += 1
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        self.cache.insert(key, pixmap)
+        for callback in callbacks:
+            callback(pixmap)
+
+    #------PUBLIC------
+
+    def load(self, source, crop: ImageCrop, size: Vec2, pr: float, callback = None) -> QtGui.QPixmap|None:
+        # Returns the pixmap at once on a cache hit, otherwise decodes on a worker and calls callback(pixmap) later
+        key = self.cache.key(source, crop, size, pr)
+        pixmap = self.cache.lookup(key)
+        if pixmap is not None:
+            return pixmap
+        waiting = self._waiting.get(key)
+        if waiting is None:
+            self.cache.misses += 1
+            waiting = self._waiting[key] = []
+            self._pool.start(_ImageTask(self, key, source, crop, size, pr))
+        if callback is not None:
+            waiting.append(callback)
+        return None
+
+    def pending(self) -> int:
+        return len(self._waiting)
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        done = self._pool.waitForDone(msecs)
+        QtCore.QCoreApplication.sendPostedEvents(self)
+        return done
+
+_imageLoader = None
+
+def imageLoader() -> ImageLoader:
+    global _imageLoader
+    if _imageLoader is None:
+        _imageLoader = ImageLoader(parent=QtCore.QCoreApplication.instance())
+    return _imageLoader
+
+backgroundCache = PixmapCache(8 * 1024 * 1024)
+
+def _renderBackground(width: int, height: int, color: QtGui.QColor, pr: float):
+    # Everything drawn behind the toast content goes here, it runs once per size and colour
+    pm = QtGui.QPixmap(max(1, int(width * pr)), max(1, int(height * pr)))
+    pm.setDevicePixelRatio(pr)
+    pm.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(pm)
+    painter.fillRect(QtCore.QRectF(0, 0, width, height), color)
+    painter.end()
+    return pm
+
+def backgroundPixmap(width: int, height: int, color: QtGui.QColor, pr: float = 1.0) -> QtGui.QPixmap:
+    key = ("background", width, height, color.rgba(), pr)
+    return backgroundCache.cached(key, lambda: _renderBackground(width, height, color, pr))
@@ -0,0 +1,61 @@
+from PyQt5 import QtCore, QtGui
+from collections import OrderedDict
+
+class TextMeasurer:
+    def __init__(self, maxEntries: int = 2048):
+        # Measured sizes keyed by (text, font, max width, wrap), so a toast is sized in one pass
+        self.maxEntries = maxEntries
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._metrics = dict()
+
+    #------PRIVATES------
+
+    def _fontMetrics(self, font: QtGui.QFont, fontKey: str):
+        fm = self._metrics.get(fontKey)
+        if fm is None:
+            fm = QtGui.QFontMetrics(font)
+            self._metrics[fontKey] = fm
+        return fm
+
+    def _measure(self, text: str, font: QtGui.QFont, fontKey: str, maxWidth: int, wrap: bool):
+        fm = self._fontMetrics(font, fontKey)
+        if maxWidth > 0 and wrap:
+            rect = fm.boundingRect(QtCore.QRect(0, 0, maxWidth, 1 << 20), QtCore.Qt.TextWordWrap, text)
+            return text, QtCore.QSize(min(rect.width(), maxWidth), rect.height())
+        if maxWidth > 0:
+            text = "\n".join(fm.elidedText(line, QtCore.Qt.ElideRight, maxWidth) for line in text.split("\n"))
+        rect = fm.boundingRect(QtCore.QRect(0, 0, 1 << 20, 1 << 20), 0, text)
+        return text, QtCore.QSize(rect.width(), rect.height())
+
+    #------PUBLIC------
+
+    def measure(self, text: str, font: QtGui.QFont, maxWidth: int = 0, wrap: bool = False):
+        # Returns (text to display, size); text is elided when it does not fit and wrap is off
+        fontKey = font.key()
+        key = (text, fontKey, maxWidth, wrap)
+        item = self._items.get(key)
+        if item is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return item
+        self.misses += 1
+        item = self._measure(text, font, fontKey, maxWidth, wrap)
+        self._items[key] = item
+        if len(self._items) > self.maxEntries:
+            self._items.popitem(last=False)
+        return item
+
+    def clear(self):
+        self._items.clear()
+        self._metrics.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._items),
+        }
+
+textMeasurer = TextMeasurer()
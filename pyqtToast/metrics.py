@@ -0,0 +1,216 @@
+from PyQt5 import QtCore
+import os
+import re
+import time
+from collections.abc import Callable
+
+# Lifecycle events, each reported with a duration in seconds:
+#   construct    time spent in Toast.__init__
+#   setup        time spent building and laying out the toast in _setupUi
+#   image        from the image request to the pixmap being set
+#   first_paint  from show() to the first paintEvent
+#   shown        from show() to the end of the show animation
+#   hide         from show() to the toast being hidden
+#   destroy      lifetime of the toast object
+EVENTS = ("construct", "setup", "image", "first_paint", "shown", "hide", "destroy")
+
+class ToastMetrics(QtCore.QObject):
+    event = QtCore.pyqtSignal(str, object, float)
+
+    def __init__(self, parent: QtCore.QObject|None = None):
+        super(ToastMetrics, self).__init__(parent)
+        self.created = 0
+        self.deleted = 0
+        self._hooks = []
+        self._sources = dict()
+        self._count = dict.fromkeys(EVENTS, 0)
+        self._sum = dict.fromkeys(EVENTS, 0.0)
+        self._max = dict.fromkeys(EVENTS, 0.0)
+
+    #------PRIVATES------
+
+    def _record(self, name: str, toast, seconds: float):
+        self._count[name] += 1
+        self._sum[name] += seconds
+        if seconds > self._max[name]:
+            self._max[name] = seconds
+        for hook in self._hooks:
+            hook(name, toast, seconds)
+        self.event.emit(name, toast, seconds)
+
+    def _constructed(self, toast, seconds: float):
+        self.created += 1
+        born = time.perf_counter()
+        # The toast wrapper is gone by the time destroyed fires, only the lifetime is reported
+        toast.destroyed.connect(lambda _=None, born=born: self._destroyed(born))
+        self._record("construct", toast, seconds)
+
+    def _destroyed(self, born: float):
+        self.deleted += 1
+        self._record("destroy", None, time.perf_counter() - born)
+
+    #------PUBLIC------
+
+    def addHook(self, callback: Callable):
+        # callback(name, toast, seconds); toast is None for "destroy"
+        self._hooks.append(callback)
+
+    def removeHook(self, callback: Callable):
+        if callback in self._hooks:
+            self._hooks.remove(callback)
+
+    def addSource(self, name: str, stats: Callable):
+        # stats() returns a dict, its numeric values are exported as gauges
+        self._sources[name] = stats
+
+    def removeSource(self, name: str):
+        self._sources.pop(name, None)
+
+    def watch(self, dispatcher):
+        self.addSource("dispatcher", dispatcher.stats)
+        self.addSource("pool", dispatcher.pool.stats)
+
+    def live(self) -> int:
+        return self.created - self.deleted
+
+    def snapshot(self) -> dict:
+        events = dict()
+        for name in EVENTS:
+            count = self._count[name]
+            events[name] = {
+                "count": count,
+                "mean_ms": self._sum[name] / count * 1000 if count > 0 else 0.0,
+                "max_ms": self._max[name] * 1000,
+                "sum_s": self._sum[name],
+            }
+        sources = dict()
+        for name, stats in self._sources.items():
+            sources[name] = {key: value for key, value in stats().items() if isinstance(value, (int, float))}
+        return {
+            "live": self.live(),
+            "constructed": self.created,
+            "destroyed": self.deleted,
+            "events": events,
+            "sources": sources,
+        }
+
+    def prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = [
+            "# TYPE pyqttoast_live_toasts gauge",
+            "pyqttoast_live_toasts %d" % snapshot["live"],
+            "# TYPE pyqttoast_constructed_total counter",
+            "pyqttoast_constructed_total %d" % snapshot["constructed"],
+            "# TYPE pyqttoast_destroyed_total counter",
+            "pyqttoast_destroyed_total %d" % snapshot["destroyed"],
+            "# TYPE pyqttoast_event_seconds summary",
+        ]
+        for name, event in snapshot["events"].items():
+            lines.append('pyqttoast_event_seconds_count{event="%s"} %d' % (name, event["count"]))
+            lines.append('pyqttoast_event_seconds_sum{event="%s"} %.9f' % (name, event["sum_s"]))
+        lines.append("# TYPE pyqttoast_event_seconds_max gauge")
+        for name, event in snapshot["events"].items():
+            lines.append('pyqttoast_event_seconds_max{event="%s"} %.9f' % (name, event["max_ms"] / 1000))
+        for source, stats in snapshot["sources"].items():
+            for key, value in stats.items():
+                metric = "pyqttoast_%s_%s" % (source, re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower())
+                lines.append("# TYPE %s gauge" % metric)
+                lines.append("%s %s" % (metric, float(value)))
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        for name in EVENTS:
+            self._count[name] = 0
+            self._sum[name] = 0.0
+            self._max[name] = 0.0
+
+class MetricsExporter(QtCore.QObject):
+    def __init__(self, metrics: ToastMetrics, path: str|None = None, port: int|None = None, intervalMs: int = 10000, parent: QtCore.QObject|None = None):
+        # Writes Prometheus text to path every intervalMs and/or serves it on 127.0.0.1:port
+        super(MetricsExporter, self).__init__(parent)
+        self.metrics = metrics
+        self.path = path
+        self._clients = dict()
+        self._server = None
+        self.writeErrors = 0
+        self.lastError = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._tryWrite)
+        if path is not None:
+            self._timer.start(intervalMs)
+
+        if port is not None:
+            # QtNetwork is only loaded when the endpoint is used
+            from PyQt5 import QtNetwork
+            self._server = QtNetwork.QTcpServer(self)
+            self._server.newConnection.connect(self._onConnection)
+            if not self._server.listen(QtNetwork.QHostAddress.LocalHost, port):
+                raise OSError(self._server.errorString())
+
+    #------PRIVATES------
+
+    def _onConnection(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            # Keep the wrapper alive, otherwise its slot connections are collected with it
+            self._clients[sock] = b""
+            sock.readyRead.connect(lambda s=sock: self._onReadyRead(s))
+            sock.disconnected.connect(lambda s=sock: self._onDisconnected(s))
+
+    def _onDisconnected(self, sock):
+        self._clients.pop(sock, None)
+        sock.deleteLater()
+
+    def _onReadyRead(self, sock):
+        # Any request gets the metrics, only the end of the headers is looked for
+        data = self._clients.get(sock, b"") + bytes(sock.readAll())
+        self._clients[sock] = data
+        if b"\r\n\r\n" not in data:
+            return
+        body = self.metrics.prometheus().encode()
+        sock.write(b"HTTP/1.0 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\nContent-Length: %d\r\n\r\n" % len(body))
+        sock.write(body)
+        sock.disconnectFromHost()
+
+    def _tryWrite(self):
+        # An exception in a timer slot aborts PyQt, the exporter must not take the application down with it
+        try:
+            self.write()
+            self.lastError = None
+        except OSError as e:
+            self.writeErrors += 1
+            self.lastError = str(e)
+
+    #------PUBLIC------
+
+    def port(self) -> int:
+        return self._server.serverPort() if self._server is not None else 0
+
+    def write(self):
+        if self.path is None:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(self.metrics.prometheus())
+        os.replace(tmp, self.path)
+
+    def close(self):
+        self._timer.stop()
+        if self._server is not None:
+            self._server.close()
+
+_metrics = None
+
+def toastMetrics() -> ToastMetrics:
+    # Toasts report to the metrics only once this has been called, until then instrumentation costs nothing
+    global _metrics
+    if _metrics is None:
+        _metrics = ToastMetrics(parent=QtCore.QCoreApplication.instance())
+        from .images import pixmapCache
+        from .layout import textMeasurer
+        from .options import optionModels
+        _metrics.addSource("images", pixmapCache.stats)
+        _metrics.addSource("layout", textMeasurer.stats)
+        _metrics.addSource("options", optionModels.stats)
+    return _metrics
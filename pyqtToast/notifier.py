@@ -0,0 +1,107 @@
+from PyQt5 import QtCore
+import queue
+import asyncio
+import threading
+import concurrent.futures
+from collections.abc import Sequence
+
+from .config import Config
+from .dispatcher import ToastDispatcher
+
+class ToastNotifier(QtCore.QObject):
+    _wakeup = QtCore.pyqtSignal()
+
+    def __init__(self, dispatcher: ToastDispatcher|None = None, maxBacklog: int = 1000, parent: QtCore.QObject|None = None):
+        # Must be created on the GUI thread, submit()/notify() may then be called from any thread
+        super(ToastNotifier, self).__init__(parent)
+        global _defaultNotifier
+        self.dispatcher = dispatcher if dispatcher is not None else ToastDispatcher(parent=self)
+        self._backlog = queue.Queue(maxBacklog)
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._wakeup.connect(self._process, QtCore.Qt.QueuedConnection)
+        if _defaultNotifier is None:
+            _defaultNotifier = self
+
+    #------PRIVATES------
+
+    def _wrap(self, future: concurrent.futures.Future, event: str, name: str, callback):
+        def wrapped(*args):
+            if callback is not None:
+                callback(*args)
+            if not future.done():
+                result = {"event": event, "name": name}
+                if event == "action" and len(args) > 0:
+                    result["value"] = args[0]
+                future.set_result(result)
+        return wrapped
+
+    def _finish(self, future: concurrent.futures.Future, reason: str):
+        if not future.done():
+            future.set_result({"event": reason})
+
+    def _process(self):
+        with self._lock:
+            self._scheduled = False
+        while True:
+            try:
+                config, priority, key, future = self._backlog.get_nowait()
+            except queue.Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            # Callbacks are wrapped in a copy, a config submitted twice must not resolve both futures
+            if config.hasButtons() or config.hasActions():
+                config = config.copy()
+            if config.hasButtons():
+                config.BUTTONS = {name: b._replace(callback=self._wrap(future, "button", name, b.callback)) for name, b in config.BUTTONS.items()}
+            if config.hasActions():
+                config.ACTIONS = {name: a._replace(callback=self._wrap(future, "action", name, a.callback)) for name, a in config.ACTIONS.items()}
+            self.dispatcher.notify(config, priority, key, lambda reason, f=future: self._finish(f, reason))
+
+    def _put(self, config: Config, priority: int, key: str|None):
+        future = concurrent.futures.Future()
+        # Raises queue.Full when the backlog is at maxBacklog
+        self._backlog.put_nowait((config, priority, key, future))
+        return future
+
+    def _schedule(self):
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wakeup.emit()
+
+    #------PUBLIC------
+
+    def submit(self, config: Config, priority: int = 0, key: str|None = None) -> concurrent.futures.Future:
+        future = self._put(config, priority, key)
+        self._schedule()
+        return future
+
+    def submitMany(self, configs: Sequence[Config], priority: int = 0) -> list:
+        futures = []
+        try:
+            for config in configs:
+                futures.append(self._put(config, priority, None))
+        finally:
+            self._schedule()
+        return futures
+
+    async def submitAsync(self, config: Config, priority: int = 0, key: str|None = None) -> dict:
+        return await asyncio.wrap_future(self.submit(config, priority, key))
+
+    def backlog(self) -> int:
+        return self._backlog.qsize()
+
+_defaultNotifier = None
+
+def notify(config: Config, priority: int = 0, key: str|None = None) -> concurrent.futures.Future:
+    # Thread-safe entry point, the future resolves with {"event": "hidden"|"coalesced"|"dropped"}
+    # or {"event": "button"|"action", "name": ...} when a callback fires first
+    if _defaultNotifier is None:
+        raise RuntimeError("create a ToastNotifier on the GUI thread before calling notify()")
+    return _defaultNotifier.submit(config, priority, key)
+
+async def notifyAsync(config: Config, priority: int = 0, key: str|None = None) -> dict:
+    return await asyncio.wrap_future(notify(config, priority, key))
@@ -0,0 +1,82 @@
+from PyQt5 import QtCore, QtGui
+import os
+import weakref
+from collections import OrderedDict
+from collections.abc import Sequence
+
+class OptionModels:
+    def __init__(self, maxEntries: int = 64):
+        # One QStringListModel per option list, shared by every select action showing it.
+        # Recent lists stay cached, lists still shown by a combo box are kept alive by it.
+        self.maxEntries = maxEntries
+        self.hits = 0
+        self.misses = 0
+        self._recent = OrderedDict()
+        self._live = weakref.WeakValueDictionary()
+
+    def get(self, options: Sequence[str]) -> QtCore.QStringListModel:
+        key = tuple(options)
+        model = self._recent.get(key)
+        if model is None:
+            model = self._live.get(key)
+        if model is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            model = QtCore.QStringListModel(list(key))
+            self._live[key] = model
+        self._recent[key] = model
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.maxEntries:
+            self._recent.popitem(last=False)
+        return model
+
+    def clear(self):
+        self._recent.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._recent),
+            "live": len(self._live),
+        }
+
+optionModels = OptionModels()
+
+class IconCache:
+    def __init__(self, maxEntries: int = 256):
+        # Button icons are loaded from disk once per path and modification time
+        self.maxEntries = maxEntries
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def get(self, path: str) -> QtGui.QIcon:
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            key = (path, 0)
+        icon = self._items.get(key)
+        if icon is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return icon
+        self.misses += 1
+        icon = QtGui.QIcon(path)
+        self._items[key] = icon
+        if len(self._items) > self.maxEntries:
+            self._items.popitem(last=False)
+        return icon
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._items),
+        }
+
+iconCache = IconCache()
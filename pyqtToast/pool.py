@@ -0,0 +1,80 @@
+from PyQt5 import QtCore
+from enum import Enum
+
+from .config import Config
+from .toast import Toast
+
+class PoolEviction(Enum):
+    DROP_RETURNED = 1
+    DROP_OLDEST = 2
+
+class ToastPool(QtCore.QObject):
+    def __init__(self, maxSize: int = 8, eviction: PoolEviction = PoolEviction.DROP_OLDEST, parent: QtCore.QObject|None = None):
+        super(ToastPool, self).__init__(parent)
+        self.maxSize = maxSize
+        self.eviction = eviction
+        self._idle = []
+        self._active = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    #------PRIVATES------
+
+    def _destroy(self, toast: Toast):
+        self.evictions += 1
+        toast.popuphidden.disconnect(toast._poolRelease)
+        toast.deleteLater()
+
+    def _release(self, toast: Toast):
+        if toast not in self._active:
+            return
+        self._active.discard(toast)
+        toast._dropResources()
+        if len(self._idle) < self.maxSize:
+            self._idle.append(toast)
+        elif self.eviction == PoolEviction.DROP_OLDEST and self.maxSize > 0:
+            self._destroy(self._idle.pop(0))
+            self._idle.append(toast)
+        else:
+            self._destroy(toast)
+
+    #------PUBLIC------
+
+    def acquire(self, config: Config|None = None) -> Toast:
+        if len(self._idle) > 0:
+            self.hits += 1
+            toast = self._idle.pop()
+            toast._reset()
+            toast.setConfig(config if config is not None else Config())
+        else:
+            self.misses += 1
+            toast = Toast(config=config)
+            toast.setDeleteOnHide(False)
+            toast._poolRelease = lambda t=toast: self._release(t)
+            toast.popuphidden.connect(toast._poolRelease)
+        self._active.add(toast)
+        return toast
+
+    def show(self, config: Config) -> Toast:
+        toast = self.acquire(config)
+        toast.show()
+        return toast
+
+    def setMaxSize(self, data: int):
+        self.maxSize = data
+        while len(self._idle) > self.maxSize:
+            self._destroy(self._idle.pop(0))
+
+    def clear(self):
+        while len(self._idle) > 0:
+            self._destroy(self._idle.pop(0))
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "idle": len(self._idle),
+            "active": len(self._active),
+        }
@@ -0,0 +1,64 @@
+from PyQt5 import QtCore, QtGui, QtWidgets
+from collections.abc import Iterable
+
+from .config import Config
+from .toast import Toast
+from .images import imageLoader, hasImage
+
+class ToastRenderer:
+    def __init__(self, pr: float = 1.0):
+        # One hidden toast is laid out for every config, the widgets, fonts and pixmap caches are shared
+        self.pr = pr
+        self.rendered = 0
+        self._toast = None
+
+    #------PRIVATES------
+
+    def _prepare(self, config: Config) -> Toast:
+        if self._toast is None:
+            self._toast = Toast(config=config)
+            self._toast.setDeleteOnHide(False)
+            self._toast._renderPr = self.pr
+        toast = self._toast
+        toast.setConfig(config)
+        if hasImage(config.IMAGE):
+            # Decoded here so _setupUi finds the pixmap in the cache instead of loading it on a worker
+            imageLoader().cache.get(config.IMAGE, config.IMAGE_CROP, config.IMAGE_SIZE, self.pr)
+        toast._setupUi()
+        toast._mainLayout.activate()
+        return toast
+
+    #------PUBLIC------
+
+    def render(self, config: Config) -> QtGui.QImage:
+        toast = self._prepare(config)
+        size = toast.size()
+        image = QtGui.QImage(int(size.width() * self.pr), int(size.height() * self.pr), QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(self.pr)
+        image.fill(QtCore.Qt.transparent)
+        toast.render(image, QtCore.QPoint(), QtGui.QRegion(), QtWidgets.QWidget.DrawChildren)
+        self.rendered += 1
+        return image
+
+    def renderPng(self, config: Config, quality: int = -1) -> bytes:
+        # quality follows QImage.save, for PNG a higher value means less compression and faster encoding
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        self.render(config).save(buffer, "PNG", quality)
+        return bytes(data)
+
+    def renderMany(self, configs: Iterable[Config], png: bool = False, quality: int = -1):
+        for config in configs:
+            yield self.renderPng(config, quality) if png else self.render(config)
+
+    def close(self):
+        if self._toast is not None:
+            self._toast.deleteLater()
+            self._toast = None
+
+def renderToast(config: Config, pr: float = 1.0) -> QtGui.QImage:
+    renderer = ToastRenderer(pr)
+    image = renderer.render(config)
+    renderer.close()
+    return image
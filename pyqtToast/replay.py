@@ -0,0 +1,269 @@
+from PyQt5 import QtCore
+import os
+import json
+import time
+import random
+from typing import NamedTuple
+from collections.abc import Sequence
+
+from .config import Config
+from .toast import Toast
+from .pool import ToastPool
+from .stack import ToastStack
+from .driver import AnimationDriver
+from .dispatcher import ToastDispatcher
+from .metrics import toastMetrics
+
+# Replays a stream of notifications against live toasts and measures how the GUI copes.
+# A stream is JSONL, one notification per line:
+#   {"t": 0.25, "config": {...Config.toDict()...}, "priority": 0, "key": "ci"}
+# t is in seconds and only differences matter; a bare Config dict is also accepted and
+# a line without t arrives together with the previous one.
+
+TARGETS = ("toast", "stack", "pool", "dispatcher")
+
+class ReplayEvent(NamedTuple):
+    t: float
+    config: Config
+    priority: int = 0
+    key: str|None = None
+
+def loadStream(path: str) -> list:
+    events = []
+    t = 0.0
+    start = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line == "":
+                continue
+            data = json.loads(line)
+            item = data.get("config")
+            if not isinstance(item, dict):
+                item, data = data, dict()
+            if data.get("t") is not None:
+                if start is None:
+                    start = float(data["t"])
+                t = float(data["t"]) - start
+            events.append(ReplayEvent(t, Config.fromDict(item), int(data.get("priority", 0)), data.get("key")))
+    events.sort(key=lambda e: e.t)
+    return events
+
+def writeStream(path: str, events: Sequence[ReplayEvent]):
+    with open(path, "w") as f:
+        for event in events:
+            data = {"t": round(event.t, 6), "config": event.config.toDict()}
+            if event.priority != 0:
+                data["priority"] = event.priority
+            if event.key is not None:
+                data["key"] = event.key
+            f.write(json.dumps(data, separators=(",", ":")) + "\n")
+
+def poissonStream(templates: Sequence[Config], rate: float, count: int, burst: int = 1, seed: int|None = None) -> list:
+    # Arrivals with exponential gaps at rate per second, each delivering burst notifications
+    rng = random.Random(seed)
+    events = []
+    t = 0.0
+    while len(events) < count:
+        t += rng.expovariate(rate)
+        for _ in range(min(burst, count - len(events))):
+            events.append(ReplayEvent(t, templates[len(events) % len(templates)].copy()))
+    return events
+
+def speedUp(events: Sequence[ReplayEvent], speed: float) -> list:
+    return [event._replace(t=event.t / speed) for event in events]
+
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _percentiles(values: list) -> dict:
+    # values in seconds, reported in milliseconds
+    if len(values) == 0:
+        return {"n": 0}
+    values = sorted(values)
+    n = len(values)
+    pick = lambda q: values[min(n - 1, int(n * q))] * 1000
+    return {"n": n, "mean_ms": sum(values) / n * 1000, "p50_ms": pick(0.5), "p90_ms": pick(0.9), "p99_ms": pick(0.99), "max_ms": values[-1] * 1000}
+
+class ToastReplay(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, events: Sequence[ReplayEvent], target: str = "stack", duration: int|None = None, useDriver: bool = False,
+                 maxVisible: int = 5, dispatchRate: float = 2.0, frameMs: int = 16, sampleMs: int = 250, drainMs: int = 10000,
+                 parent: QtCore.QObject|None = None):
+        # target: "toast" shows bare toasts, "stack" stacks them, "pool" recycles stacked toasts,
+        # "dispatcher" queues them through a ToastDispatcher. duration overrides DURATION.
+        super(ToastReplay, self).__init__(parent)
+        if target not in TARGETS:
+            raise ValueError("unknown target %r" % target)
+        self.events = list(events)
+        self.target = target
+        self.duration = duration
+        self.frameMs = frameMs
+        self.drainMs = drainMs
+
+        self.driver = AnimationDriver(parent=self) if useDriver else None
+        self.stack = ToastStack(parent=self) if target in ("stack", "pool") else None
+        self.pool = ToastPool(maxSize=maxVisible * 2, parent=self) if target == "pool" else None
+        self.dispatcher = ToastDispatcher(maxVisible=maxVisible, rate=dispatchRate, driver=self.driver, parent=self) if target == "dispatcher" else None
+
+        self._next = 0
+        self._start = 0.0
+        self._arrivals = dict()
+        self._visible = set()
+        self._toasts = set()
+        self._latency = []
+        self._lateness = []
+        self._frames = []
+        self._dropped = 0
+        self._lastFrame = None
+        self._peakVisible = 0
+        self._peakLive = 0
+        self._samples = []
+        self._liveBase = 0
+        self._drainStart = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._frameTimer = QtCore.QTimer(self)
+        self._frameTimer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._frameTimer.timeout.connect(self._onFrame)
+
+        self._sampleTimer = QtCore.QTimer(self)
+        self._sampleTimer.timeout.connect(self._sample)
+        self._sampleTimer.setInterval(sampleMs)
+
+    #------PRIVATES------
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._start
+
+    def _show(self, event: ReplayEvent):
+        config = event.config
+        if self.duration is not None:
+            config.DURATION = self.duration
+        # Latency is matched on the config object, it is the one the shown toast ends up with
+        self._arrivals[id(config)] = (config, self._start + event.t)
+        if self.dispatcher is not None:
+            self.dispatcher.notify(config, event.priority, event.key)
+            return
+        if self.pool is not None:
+            toast = self.pool.acquire(config)
+        else:
+            toast = Toast(config=config)
+            # Nothing else references a bare toast, it would be collected before it is painted
+            self._toasts.add(toast)
+            toast.popuphidden.connect(lambda t=toast: self._toasts.discard(t))
+        if self.driver is not None and toast._driver is not self.driver:
+            toast.setAnimationDriver(self.driver)
+        if self.stack is not None:
+            self.stack.add(toast)
+        toast.show()
+
+    def _dispatch(self):
+        now = self._now()
+        while self._next < len(self.events) and self.events[self._next].t <= now:
+            event = self.events[self._next]
+            self._next += 1
+            self._lateness.append(now - event.t)
+            self._show(event)
+            now = self._now()
+        if self._next < len(self.events):
+            self._timer.start(max(0, int((self.events[self._next].t - now) * 1000)))
+        else:
+            self._drainStart = now
+            self._checkDone()
+
+    def _onFrame(self):
+        now = time.perf_counter()
+        if self._lastFrame is not None:
+            gap = now - self._lastFrame
+            self._frames.append(gap)
+            self._dropped += max(0, int(gap * 1000 / self.frameMs + 0.5) - 1)
+        self._lastFrame = now
+        self._checkDone()
+
+    def _onEvent(self, name: str, toast, seconds: float):
+        if name == "first_paint":
+            arrival = self._arrivals.pop(id(toast.config), None)
+            if arrival is not None and arrival[0] is toast.config:
+                self._latency.append(time.perf_counter() - arrival[1])
+            self._visible.add(toast)
+            self._peakVisible = max(self._peakVisible, len(self._visible))
+            self._peakLive = max(self._peakLive, toastMetrics().live() - self._liveBase)
+        elif name == "hide":
+            self._visible.discard(toast)
+
+    def _sample(self):
+        live = toastMetrics().live() - self._liveBase
+        self._peakLive = max(self._peakLive, live)
+        self._samples.append({"t": round(self._now(), 3), "rss": _rss(), "live": live, "visible": len(self._visible)})
+
+    def _checkDone(self):
+        if self._drainStart is None:
+            return
+        if len(self._visible) > 0 and (self._now() - self._drainStart) * 1000 < self.drainMs:
+            return
+        if self.dispatcher is not None and self.dispatcher.pending() > 0 and (self._now() - self._drainStart) * 1000 < self.drainMs:
+            return
+        self._drainStart = None
+        self._frameTimer.stop()
+        self._sampleTimer.stop()
+        self._sample()
+        toastMetrics().removeHook(self._onEvent)
+        self.finished.emit(self.report())
+
+    #------PUBLIC------
+
+    def start(self):
+        metrics = toastMetrics()
+        metrics.addHook(self._onEvent)
+        self._liveBase = metrics.live()
+        self._start = time.perf_counter()
+        self._sample()
+        self._frameTimer.start(self.frameMs)
+        self._sampleTimer.start()
+        self._dispatch()
+
+    def report(self) -> dict:
+        frames = sorted(self._frames)
+        result = {
+            "target": self.target,
+            "events": len(self.events),
+            "elapsed_s": self._now(),
+            "shown": len(self._latency),
+            "latency": _percentiles(self._latency),
+            "lateness": _percentiles(self._lateness),
+            "frames": len(frames),
+            "dropped_frames": self._dropped,
+            "frame_gap": _percentiles(frames),
+            "peak_visible": self._peakVisible,
+            "peak_live": self._peakLive,
+            "rss_start": self._samples[0]["rss"] if len(self._samples) > 0 else 0,
+            "rss_peak": max((s["rss"] for s in self._samples), default=0),
+            "samples": self._samples,
+        }
+        if self.dispatcher is not None:
+            result["dispatcher"] = self.dispatcher.stats()
+        if self.pool is not None:
+            result["pool"] = self.pool.stats()
+        return result
+
+def replay(events: Sequence[ReplayEvent], **options) -> dict:
+    # Runs the replay to the end in a local event loop, a QApplication must exist
+    runner = ToastReplay(events, **options)
+    loop = QtCore.QEventLoop()
+    result = dict()
+    runner.finished.connect(lambda report: (result.update(report), loop.quit()))
+    runner.start()
+    if len(result) == 0:
+        loop.exec_()
+    return result
@@ -0,0 +1,101 @@
+from PyQt5 import QtCore, QtGui
+
+from .config import ShowScreenType, Config
+
+class ScreenCache(QtCore.QObject):
+    changed = QtCore.pyqtSignal()
+
+    def __init__(self, parent: QtCore.QObject|None = None):
+        # Geometry and pixel ratio of every screen, refreshed only when Qt reports a change
+        super(ScreenCache, self).__init__(parent)
+        self._screens = dict()
+        self._primary = None
+        app = QtGui.QGuiApplication.instance()
+        app.screenAdded.connect(self._onScreenAdded)
+        app.screenRemoved.connect(self._onScreenRemoved)
+        app.primaryScreenChanged.connect(self._onPrimaryChanged)
+        for screen in QtGui.QGuiApplication.screens():
+            self._watch(screen)
+        self._primary = QtGui.QGuiApplication.primaryScreen()
+
+    #------PRIVATES------
+
+    def _watch(self, screen: QtGui.QScreen):
+        screen.availableGeometryChanged.connect(lambda _, s=screen: self._refresh(s))
+        screen.geometryChanged.connect(lambda _, s=screen: self._refresh(s))
+        screen.logicalDotsPerInchChanged.connect(lambda _, s=screen: self._refresh(s))
+        self._store(screen)
+
+    def _store(self, screen: QtGui.QScreen):
+        self._screens[screen] = (screen.name(), screen.geometry(), screen.availableGeometry(), screen.devicePixelRatio())
+
+    def _refresh(self, screen: QtGui.QScreen):
+        if screen in self._screens:
+            self._store(screen)
+            self.changed.emit()
+
+    def _onScreenAdded(self, screen: QtGui.QScreen):
+        self._watch(screen)
+        self.changed.emit()
+
+    def _onScreenRemoved(self, screen: QtGui.QScreen):
+        self._screens.pop(screen, None)
+        if screen is self._primary:
+            self._primary = QtGui.QGuiApplication.primaryScreen()
+        self.changed.emit()
+
+    def _onPrimaryChanged(self, screen: QtGui.QScreen):
+        self._primary = screen
+        self.changed.emit()
+
+    def _valid(self, screen: QtGui.QScreen|None):
+        if screen is None or screen not in self._screens:
+            return self._primary
+        return screen
+
+    #------PUBLIC------
+
+    def screens(self) -> list:
+        return list(self._screens)
+
+    def primary(self) -> QtGui.QScreen:
+        return self._primary
+
+    def byName(self, name: str) -> QtGui.QScreen|None:
+        for screen, info in self._screens.items():
+            if info[0] == name:
+                return screen
+        return None
+
+    def at(self, point: QtCore.QPoint) -> QtGui.QScreen|None:
+        for screen, info in self._screens.items():
+            if info[1].contains(point):
+                return screen
+        return None
+
+    def screenFor(self, config: Config) -> QtGui.QScreen:
+        if config.SHOW_SCREEN == ShowScreenType.CURSOR:
+            return self._valid(self.at(QtGui.QCursor.pos()))
+        if config.SHOW_SCREEN == ShowScreenType.ACTIVE_WINDOW:
+            # Only windows of this application are visible to Qt
+            window = QtGui.QGuiApplication.focusWindow()
+            return self._valid(window.screen() if window is not None else self.at(QtGui.QCursor.pos()))
+        if config.SHOW_SCREEN == ShowScreenType.NAMED:
+            return self._valid(self.byName(config.SCREEN_NAME))
+        return self._primary
+
+    def availableGeometry(self, screen: QtGui.QScreen|None = None) -> QtCore.QRect:
+        info = self._screens.get(self._valid(screen))
+        return info[2] if info is not None else QtCore.QRect()
+
+    def devicePixelRatio(self, screen: QtGui.QScreen|None = None) -> float:
+        info = self._screens.get(self._valid(screen))
+        return info[3] if info is not None else 1.0
+
+_screenCache = None
+
+def screenCache() -> ScreenCache:
+    global _screenCache
+    if _screenCache is None:
+        _screenCache = ScreenCache(parent=QtCore.QCoreApplication.instance())
+    return _screenCache
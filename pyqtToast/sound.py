@@ -0,0 +1,108 @@
+from PyQt5 import QtCore
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+class SoundPlayer(QtCore.QObject):
+    def __init__(self, maxConcurrent: int = 2, dedupeMs: int = 250, maxCached: int = 32, parent: QtCore.QObject|None = None):
+        super(SoundPlayer, self).__init__(parent)
+        self.maxConcurrent = maxConcurrent
+        self.dedupeMs = dedupeMs
+        self.maxCached = maxCached
+        self.played = 0
+        self.deduped = 0
+        self.dropped = 0
+        self._effects = OrderedDict()
+        self._pending = set()
+        self._lastPlayed = dict()
+        try:
+            from PyQt5.QtMultimedia import QSoundEffect
+            self._effectClass = QSoundEffect
+            self.available = True
+        except ImportError:
+            # No audio backend, toasts stay silent
+            self._effectClass = None
+            self.available = False
+
+    #------PRIVATES------
+
+    def _effect(self, path: str):
+        effect = self._effects.get(path)
+        if effect is not None:
+            self._effects.move_to_end(path)
+            return effect
+        # QSoundEffect decodes in the background, play() waits for statusChanged
+        effect = self._effectClass(self)
+        effect.statusChanged.connect(lambda p=path: self._onStatus(p))
+        effect.setSource(QtCore.QUrl.fromLocalFile(path))
+        self._effects[path] = effect
+        while len(self._effects) > self.maxCached:
+            oldPath, old = self._effects.popitem(last=False)
+            self._pending.discard(oldPath)
+            old.stop()
+            old.deleteLater()
+        return effect
+
+    def _onStatus(self, path: str):
+        effect = self._effects.get(path)
+        if effect is None or path not in self._pending:
+            return
+        if effect.status() == self._effectClass.Ready:
+            self._pending.discard(path)
+            self._start(effect)
+        elif effect.status() == self._effectClass.Error:
+            self._pending.discard(path)
+            self.dropped += 1
+
+    def _playing(self) -> int:
+        return sum(1 for effect in self._effects.values() if effect.isPlaying())
+
+    def _start(self, effect):
+        if self._playing() >= self.maxConcurrent:
+            self.dropped += 1
+            return
+        self.played += 1
+        effect.play()
+
+    #------PUBLIC------
+
+    def preload(self, paths: Sequence[str]):
+        if not self.available:
+            return
+        for path in paths:
+            self._effect(path)
+
+    def play(self, path: str):
+        if not self.available or path == "":
+            return
+        now = time.monotonic()
+        last = self._lastPlayed.get(path)
+        # A burst of toasts with the same sound plays it once
+        if (last is not None and (now - last) * 1000 < self.dedupeMs) or path in self._pending:
+            self.deduped += 1
+            return
+        if len(self._lastPlayed) > 4 * self.maxCached:
+            self._lastPlayed.clear()
+        self._lastPlayed[path] = now
+        effect = self._effect(path)
+        if effect.status() == self._effectClass.Ready:
+            self._start(effect)
+        else:
+            self._pending.add(path)
+
+    def stats(self) -> dict:
+        return {
+            "available": self.available,
+            "cached": len(self._effects),
+            "played": self.played,
+            "deduped": self.deduped,
+            "dropped": self.dropped,
+        }
+
+_soundPlayer = None
+
+def soundPlayer() -> SoundPlayer:
+    global _soundPlayer
+    if _soundPlayer is None:
+        _soundPlayer = SoundPlayer(parent=QtCore.QCoreApplication.instance())
+    return _soundPlayer
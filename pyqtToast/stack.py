@@ -0,0 +1,102 @@
+from PyQt5 import QtCore
+
+from .config import ShowPosType
+from .toast import Toast
+from .screens import screenCache
+
+class ToastStack(QtCore.QObject):
+    def __init__(self, spacing: int = 10, parent: QtCore.QObject|None = None):
+        super(ToastStack, self).__init__(parent)
+        self.spacing = spacing
+        # Per screen and corner list of [toast, offset, height], offsets grow away from the corner
+        self._stacks = dict()
+        screenCache().changed.connect(self._onScreensChanged)
+
+    #------PRIVATES------
+
+    def _onScreensChanged(self):
+        screens = screenCache().screens()
+        primary = screenCache().primary()
+        for key in [key for key in self._stacks if key[0] not in screens]:
+            # Toasts of a removed screen join the end of the primary screen's stack
+            target = self._stacks.setdefault((primary, key[1]), [])
+            for entry in self._stacks.pop(key):
+                entry[0]._screen = primary
+                entry[1] = target[-1][1] + target[-1][2] + self.spacing if len(target) > 0 else 0
+                target.append(entry)
+        for entries in self._stacks.values():
+            for entry in entries:
+                entry[0]._moveTo(*self._position(entry[0], entry[1]))
+
+    def _position(self, toast: Toast, offset: int):
+        geometry = screenCache().availableGeometry(toast._screen)
+        config = toast.config
+        if config.SHOW_POS in (ShowPosType.TOP_LEFT, ShowPosType.BOTTOM_LEFT):
+            x = geometry.left() + config.POS_OFFSET.x
+        else:
+            x = geometry.left() + geometry.width() - toast.width() - config.POS_OFFSET.x
+        if config.SHOW_POS in (ShowPosType.TOP_LEFT, ShowPosType.TOP_RIGHT):
+            y = geometry.top() + config.POS_OFFSET.y + offset
+        else:
+            y = geometry.top() + geometry.height() - toast.height() - config.POS_OFFSET.y - offset
+        return x, y
+
+    def _place(self, toast: Toast):
+        entries = self._stacks.setdefault((toast._screen, toast.config.SHOW_POS), [])
+        for entry in entries:
+            if entry[0] is toast:
+                return self._position(toast, entry[1])
+        offset = 0
+        if len(entries) > 0:
+            offset = entries[-1][1] + entries[-1][2] + self.spacing
+        entries.append([toast, offset, toast.height()])
+        return self._position(toast, offset)
+
+    def _remove(self, toast: Toast):
+        for entries in self._stacks.values():
+            for i, entry in enumerate(entries):
+                if entry[0] is toast:
+                    break
+            else:
+                continue
+            del entries[i]
+            # Only the toasts stacked after the removed one move
+            delta = entry[2] + self.spacing
+            for entry in entries[i:]:
+                entry[1] -= delta
+                entry[0]._moveTo(*self._position(entry[0], entry[1]))
+            return
+
+    def _resized(self, toast: Toast):
+        for entries in self._stacks.values():
+            for i, entry in enumerate(entries):
+                if entry[0] is toast:
+                    break
+            else:
+                continue
+            delta = toast.height() - entry[2]
+            entry[2] = toast.height()
+            toast._moveTo(*self._position(toast, entry[1]))
+            for entry in entries[i + 1:]:
+                entry[1] += delta
+                entry[0]._moveTo(*self._position(entry[0], entry[1]))
+            return
+
+    def _detach(self, toast: Toast):
+        self._remove(toast)
+        toast.popuphidden.disconnect(toast._stackHidden)
+        toast._stack = None
+
+    #------PUBLIC------
+
+    def add(self, toast: Toast):
+        if toast._stack is not self:
+            if toast._stack is not None:
+                toast._stack._detach(toast)
+            toast._stack = self
+            toast._stackHidden = toast.popuphidden.connect(lambda t=toast: self._remove(t))
+
+    def count(self, pos: ShowPosType|None = None) -> int:
+        if pos is not None:
+            return sum(len(entries) for key, entries in self._stacks.items() if key[1] == pos)
+        return sum(len(entries) for entries in self._stacks.values())
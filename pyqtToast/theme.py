@@ -0,0 +1,151 @@
+from PyQt5 import QtCore, QtGui, QtWidgets
+import weakref
+from typing import NamedTuple
+
+from .config import Color
+
+class Theme(NamedTuple):
+    name: str
+    titleStyle: str = ""
+    messageStyle: str = ""
+    appNameStyle: str = ""
+    buttonStyle: str = ""
+    actionStyle: str = ""
+    progressStyle: str = ""
+    fgColor: Color|None = None
+    bgColor: Color|None = None
+
+# Object names of the toast widgets, theme rules select on them
+_SELECTORS = (
+    ("titleStyle", "QLabel#toastTitle"),
+    ("messageStyle", "QLabel#toastMessage"),
+    ("appNameStyle", "QLabel#toastAppName"),
+    ("buttonStyle", "QPushButton#toastButton"),
+    ("actionStyle", "#toastAction"),
+    ("progressStyle", "QProgressBar#toastProgress"),
+)
+
+_BEGIN = "/* pyqtToast themes */"
+_END = "/* pyqtToast themes end */"
+
+class ThemeManager(QtCore.QObject):
+    def __init__(self, parent: QtCore.QObject|None = None):
+        # Every theme is compiled into one block of the application stylesheet, scoped by the
+        # toastTheme property of the toast, so Qt parses it once instead of once per widget
+        super(ThemeManager, self).__init__(parent)
+        self.current = ""
+        self._themes = dict()
+        self._sheet = ""
+        self._installed = None
+        self._palettes = dict()
+        self._fonts = dict()
+        self._toasts = weakref.WeakSet()
+
+    #------PRIVATES------
+
+    def _compile(self):
+        rules = []
+        for theme in self._themes.values():
+            for field, selector in _SELECTORS:
+                style = getattr(theme, field)
+                if style != "":
+                    rules.append('*[toastTheme="%s"] %s { %s }' % (theme.name, selector, style))
+        self._sheet = "\n".join(rules)
+        self._fonts.clear()
+        if self._installed is not None:
+            # A block already in the application stylesheet is replaced at once, the rules of a removed
+            # theme would otherwise keep styling toasts that name it
+            self._installed = None
+            self._install()
+
+    def _install(self):
+        # Runs before a themed toast is styled, and puts the block back if the application
+        # stylesheet was replaced, e.g. by qt_material
+        app = QtWidgets.QApplication.instance()
+        sheet = app.styleSheet()
+        if self._installed is not None and sheet == self._installed:
+            return
+        begin = sheet.find(_BEGIN)
+        if begin >= 0:
+            end = sheet.find(_END, begin)
+            sheet = sheet[:begin] + (sheet[end + len(_END):] if end >= 0 else "")
+        if self._sheet != "":
+            sheet = sheet.rstrip("\n") + "\n" + _BEGIN + "\n" + self._sheet + "\n" + _END + "\n"
+        self._installed = sheet
+        app.setStyleSheet(sheet)
+
+    def _track(self, toast):
+        self._toasts.add(toast)
+
+    def _restyle(self, match):
+        for toast in list(self._toasts):
+            try:
+                if match(toast):
+                    toast._restyle()
+            except RuntimeError:
+                # Deleted toast whose wrapper is still alive
+                self._toasts.discard(toast)
+
+    #------PUBLIC------
+
+    def register(self, theme: Theme):
+        # Registering a theme again with the same name restyles the toasts using it
+        self._themes[theme.name] = theme
+        self._compile()
+        self._restyle(lambda toast: toast._themeName() == theme.name)
+
+    def unregister(self, name: str):
+        if self._themes.pop(name, None) is not None:
+            self._compile()
+            self._restyle(lambda toast: toast._themeName() == name)
+
+    def get(self, name: str) -> Theme|None:
+        return self._themes.get(name)
+
+    def themes(self) -> list:
+        return list(self._themes)
+
+    def setTheme(self, name: str):
+        # Toasts whose config has no THEME follow the current theme
+        if self.current != name:
+            self.current = name
+            self._restyle(lambda toast: toast.config.THEME == "")
+
+    def palette(self, fg: Color) -> QtGui.QPalette:
+        # Label palettes are built once per foreground colour
+        pal = self._palettes.get(fg)
+        if pal is None:
+            pal = QtGui.QPalette(QtWidgets.QApplication.palette())
+            pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor(fg.r, fg.g, fg.b))
+            self._palettes[fg] = pal
+        return pal
+
+    def font(self, name: str, objectName: str):
+        # The font the rules of a theme give a toast label, read from a hidden label once.
+        # Only the properties the rules set are marked as set, hasSize tells if they set a size.
+        key = (name, objectName)
+        entry = self._fonts.get(key)
+        if entry is None:
+            self._install()
+            probe = QtWidgets.QWidget()
+            probe.setProperty("toastTheme", name)
+            label = QtWidgets.QLabel(probe)
+            label.setObjectName(objectName)
+            label.ensurePolished()
+            font = QtGui.QFont(label.font())
+            sized = QtGui.QFont()
+            sized.setPointSize(1)
+            entry = self._fonts[key] = (font, font.resolve(sized).pointSizeF() != 1)
+            probe.deleteLater()
+        return entry
+
+    def stylesheet(self) -> str:
+        return self._sheet
+
+_themeManager = None
+
+def themeManager() -> ThemeManager:
+    global _themeManager
+    if _themeManager is None:
+        _themeManager = ThemeManager(parent=QtCore.QCoreApplication.instance())
+    return _themeManager
@@ -0,0 +1,856 @@
+from PyQt5 import QtCore, QtGui, QtWidgets
+import sys
+import time
+
+from .config import ImageCrop, CurveType, ImageAlign, TextAlign, ActionType, ShowPosType, Vec2, Color, Action, Button, Config
+from .images import imageLoader, hasImage, backgroundPixmap, _maskImage
+from .sound import soundPlayer
+from .layout import textMeasurer
+from .screens import screenCache
+from .theme import themeManager
+from .options import optionModels, iconCache
+from .expiry import expiryScheduler
+from . import metrics
+
+_EXIT_ON_HIDE = False
+
+# Optional backends are imported on first use so a plain text toast never loads them
+_globalBlur = None
+
+def _loadGlobalBlur():
+    global _globalBlur
+    if _globalBlur is None:
+        try:
+            from BlurWindow.blurWindow import GlobalBlur
+            _globalBlur = GlobalBlur
+        except ImportError:
+            _globalBlur = False
+    return _globalBlur
+
+# Fields update() reacts to, grouped by the widgets they touch
+_TEXT_FIELDS = frozenset(("TITLE", "MESSAGE", "APP_NAME", "TEXT_MAX_WIDTH"))
+_IMAGE_FIELDS = frozenset(("IMAGE", "IMAGE_CROP", "IMAGE_SIZE", "IMAGE_ALIGN"))
+_STYLE_FIELDS = frozenset(("CONTENT_SPACE", "BG_COLOR", "FG_COLOR", "TEXT_ALIGN",
+                           "TITLE_FONT_SIZE", "TITLE_STYLE", "MESSAGE_FONT_SIZE", "MESSAGE_STYLE", "APP_NAME_FONT_SIZE", "APP_NAME_STYLE", "THEME"))
+# Longer option lists are sized from a minimum text length instead of measuring every item
+_MEASURED_OPTIONS = 50
+
+_UPDATE_FIELDS = tuple(_TEXT_FIELDS | _IMAGE_FIELDS | _STYLE_FIELDS) + ("PROGRESS",)
+
+class Toast(QtWidgets.QWidget):
+    popuphidden = QtCore.pyqtSignal()
+
+    def __init__(self, title: str="", message: str="", image: str="", sound: str="", duration: int=5000, config: Config|None=None):
+        start = time.perf_counter()
+        if config is not None:
+            self.config = config
+        else:
+            self.config = Config()
+            self.config.IMAGE = image
+            self.config.SOUND = sound
+            self.config.DURATION = duration
+            self.config.TITLE = title
+            self.config.MESSAGE = message
+
+        self.__isHide = False
+        self.__isClosed = False
+        self._isUiBuilt = False
+        self._stack = None
+        self._x, self._y = 0, 0
+        self._backgroundKey = None
+        self._background = None
+        self._driver = None
+        self._imageRequest = 0
+        self._textSize = QtCore.QSize(0, 0)
+        self._history = None
+        self._historyId = None
+        self._screen = None
+        self._showStart = 0.0
+        self._imageStart = 0.0
+        self._paintPending = False
+        self._deleteOnHide = True
+        self._renderPr = None
+        self._theme = None
+        self._labelStyle = None
+        self._labelFonts = ()
+        self._bgColor = self.config.BG_COLOR
+        
+        super(Toast, self).__init__()
+        self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+
+        self._animation = QtCore.QPropertyAnimation(self, b"windowOpacity", self)
+        self._animation.finished.connect(self._hide)
+        self._animation.setEasingCurve(self.config.ANIM_FADE_CURVE)
+
+        self._animationPos = QtCore.QPropertyAnimation(self, b"pos", self)
+        self._animationPos.setEasingCurve(self.config.ANIM_POS_CURVE)
+
+        if metrics._metrics is not None:
+            metrics._metrics._constructed(self, time.perf_counter() - start)
+
+    #------PRIVATES------
+
+    def _maskImage(self, imgdata, imgtype: str ='png', size: int = 100, pr: float|None = None):
+        if pr is None:
+            pr = self._pixelRatio()
+        return _maskImage(imgdata, imgtype, size, pr)
+
+    def _pixelRatio(self) -> float:
+        # Offscreen rendering picks its own ratio, otherwise the target screen's is used
+        if self._renderPr is not None:
+            return self._renderPr
+        return screenCache().devicePixelRatio(self._screen)
+
+    def _buildUi(self):
+        # Widgets are created once per Toast and updated in place by _setupUi,
+        # so a shown and hidden toast can be configured and shown again.
+        self._mainLayout = QtWidgets.QVBoxLayout(self)
+        self._buttonsLayout = QtWidgets.QHBoxLayout()
+        self._textLayout = QtWidgets.QVBoxLayout()
+        self._hLayout = QtWidgets.QHBoxLayout()
+
+        self._mainLayout.addLayout(self._hLayout)
+        self._progress = QtWidgets.QProgressBar(self)
+        self._progress.setObjectName("toastProgress")
+        self._progress.hide()
+        self._mainLayout.addWidget(self._progress)
+        self._actionsLayout = QtWidgets.QVBoxLayout()
+        self._mainLayout.addLayout(self._actionsLayout)
+        self._mainLayout.addLayout(self._buttonsLayout)
+
+        self._mainLayout.setSpacing(1)
+        self._labelTitle = QtWidgets.QLabel(self)
+        self._labelMessage = QtWidgets.QLabel(self)
+        self._labelAppName = QtWidgets.QLabel(self)
+        # Theme rules select on these names
+        self._labelTitle.setObjectName("toastTitle")
+        self._labelMessage.setObjectName("toastMessage")
+        self._labelAppName.setObjectName("toastAppName")
+        #self._labelTitle.setStyleSheet("border: 1px solid black;")
+        #self._labelMessage.setStyleSheet("border: 1px solid black;")
+        #self._labelAppName.setStyleSheet("border: 1px solid black;")
+
+        self._textLayout.addWidget(self._labelTitle)
+        self._textLayout.addWidget(self._labelMessage)
+        self._textLayout.addWidget(self._labelAppName)
+        self._textLayout.setSpacing(0)
+
+        self._limage = QtWidgets.QLabel(self)
+        #self._limage.setStyleSheet("border: 1px solid black;")
+
+        self._actions = dict()
+        self._buttons = dict()
+        self._buttonWidgets = []
+        self._isUiBuilt = True
+
+    def _disconnect(self, signal):
+        try:
+            signal.disconnect()
+        except TypeError:
+            pass
+
+    def _setupUi(self):
+        start = time.perf_counter()
+        if not self._isUiBuilt:
+            self._buildUi()
+
+        # The target screen is picked before building so images are scaled for its pixel ratio
+        self._screen = screenCache().screenFor(self.config)
+        self._applyStyle()
+        self._applyText()
+        self._applyImage()
+        self._applyProgress()
+        self._applyActions()
+        self._applyButtons()
+
+        # Applied on every setup, a recycled toast must not keep the minimum size of its last config
+        self.setMinimumSize(self.config.MIN_SIZE.x, self.config.MIN_SIZE.y)
+        self._size = self._estimateSize()
+        self.setGeometry(QtCore.QRect(self._hLayout.geometry().x(), self._hLayout.geometry().y(), self._size.width(), self._size.height()))
+
+        if self.config.USE_BLUR_BG == True and self._renderPr is None and _loadGlobalBlur():
+            _globalBlur(self.winId(), Acrylic=self.config.USE_ACRILIC, Dark=self.config.IS_BLUR_DARK, QWidget=self)
+            # The config is left untouched, only this toast paints a transparent background
+            self._bgColor = self._bgColor._replace(a=0)
+
+        if metrics._metrics is not None:
+            metrics._metrics._record("setup", self, time.perf_counter() - start)
+
+    def _themeName(self) -> str:
+        return self.config.THEME or themeManager().current
+
+    def _applyStyle(self):
+        self._hLayout.setSpacing(self.config.CONTENT_SPACE)
+        manager = themeManager()
+        manager._track(self)
+        name = self._themeName()
+        self._theme = theme = manager.get(name)
+        fg = theme.fgColor if theme is not None and theme.fgColor is not None else self.config.FG_COLOR
+        self._bgColor = theme.bgColor if theme is not None and theme.bgColor is not None else self.config.BG_COLOR
+        if theme is not None:
+            manager._install()
+
+        # Themes are rules in the application stylesheet scoped by the toastTheme property,
+        # switching one repolishes the existing widgets
+        style = self.style()
+        polished = self.testAttribute(QtCore.Qt.WA_WState_Polished)
+        unpolished = []
+        if self.property("toastTheme") != name:
+            if polished:
+                unpolished = [self] + self.findChildren(QtWidgets.QWidget)
+                for w in unpolished:
+                    style.unpolish(w)
+            self.setProperty("toastTheme", name)
+
+        # The shared palette is only set when it changes, labels are repolished so theme colours apply over it
+        labels = (self._labelTitle, self._labelMessage, self._labelAppName)
+        labelStyle = (self.config.TITLE_FONT_SIZE, self.config.MESSAGE_FONT_SIZE, self.config.APP_NAME_FONT_SIZE, fg, theme)
+        changed = len(unpolished) > 0 or labelStyle != self._labelStyle
+        if changed:
+            self._labelStyle = labelStyle
+            if len(unpolished) == 0 and theme is not None and polished:
+                unpolished = labels
+                for w in unpolished:
+                    style.unpolish(w)
+            pal = manager.palette(fg)
+            for label in labels:
+                label.setPalette(pal)
+        for w in unpolished:
+            style.polish(w)
+            # Frames and buttons pick up padding and borders on a style change
+            QtCore.QCoreApplication.sendEvent(w, QtCore.QEvent(QtCore.QEvent.StyleChange))
+
+        self._setStyleSheet(self._labelTitle, self.config.TITLE_STYLE)
+        self._setStyleSheet(self._labelMessage, self.config.MESSAGE_STYLE)
+        self._setStyleSheet(self._labelAppName, self.config.APP_NAME_STYLE)
+        if changed:
+            sizes = (self.config.TITLE_FONT_SIZE, self.config.MESSAGE_FONT_SIZE, self.config.APP_NAME_FONT_SIZE)
+            self._labelFonts = [self._labelFont(label, size) for label, size in zip(labels, sizes)]
+        self._applyFonts()
+        self._chrome = [self._labelChrome(label) for label in (self._labelTitle, self._labelMessage, self._labelAppName)]
+
+        if self.config.TEXT_ALIGN == TextAlign.CENTER:
+            self._labelTitle.setAlignment(QtCore.Qt.AlignCenter)
+            self._labelMessage.setAlignment(QtCore.Qt.AlignCenter)
+            self._labelAppName.setAlignment(QtCore.Qt.AlignCenter)
+        elif self.config.TEXT_ALIGN == TextAlign.RIGHT:
+            self._labelTitle.setAlignment(QtCore.Qt.AlignRight)
+            self._labelMessage.setAlignment(QtCore.Qt.AlignRight)
+            self._labelAppName.setAlignment(QtCore.Qt.AlignRight)
+        elif self.config.TEXT_ALIGN == TextAlign.LEFT:
+            self._labelTitle.setAlignment(QtCore.Qt.AlignLeft)
+            self._labelMessage.setAlignment(QtCore.Qt.AlignLeft)
+            self._labelAppName.setAlignment(QtCore.Qt.AlignLeft)
+
+        # Labels are fixed to their measured size, the layout places them the way their text is aligned
+        align = self._labelTitle.alignment() & QtCore.Qt.AlignHorizontal_Mask
+        for label in (self._labelTitle, self._labelMessage, self._labelAppName):
+            self._textLayout.setAlignment(label, align)
+
+        # The background is painted from _bgColor. A window palette is not set: besides being unused,
+        # setting one leaks memory in Qt for every toast that has a combo box or button.
+
+    def _labelFont(self, label: QtWidgets.QLabel, size: int) -> QtGui.QFont:
+        if self._theme is None:
+            font = QtGui.QFont()
+            font.setPointSize(size)
+            return font
+        # setFont replaces what the theme's rules set, so the font starts from them
+        font, hasSize = themeManager().font(self._theme.name, label.objectName())
+        font = QtGui.QFont(font)
+        if not hasSize:
+            font.setPointSize(size)
+        return font
+
+    def _applyFonts(self):
+        # Set after polishing, a polish puts back the font a label had when it was first polished
+        for label, font in zip((self._labelTitle, self._labelMessage, self._labelAppName), self._labelFonts):
+            if label.font() != font:
+                label.setFont(font)
+
+    def _setStyleSheet(self, w: QtWidgets.QWidget, style: str):
+        # Every setStyleSheet call parses the sheet and repolishes the widget, unstyled widgets skip it
+        if style != "" or w.styleSheet() != "":
+            w.setStyleSheet(style)
+
+    def _labelChrome(self, label: QtWidgets.QLabel) -> QtCore.QSize:
+        # Stylesheet padding, borders and margins the font metrics do not know about
+        if label.styleSheet() == "" and self._theme is None:
+            return QtCore.QSize(0, 0)
+        label.ensurePolished()
+        label.setWordWrap(False)
+        # A styled label's size hint is bounded by the fixed size of its last layout
+        label.setMinimumSize(0, 0)
+        label.setMaximumSize(QtWidgets.QWIDGETSIZE_MAX, QtWidgets.QWIDGETSIZE_MAX)
+        label.setText("X")
+        return label.sizeHint() - textMeasurer.measure("X", label.font())[1]
+
+    def _layoutLabel(self, label: QtWidgets.QLabel, chrome: QtCore.QSize, text: str, wrap: bool) -> QtCore.QSize:
+        maxWidth = self.config.TEXT_MAX_WIDTH
+        if maxWidth > 0:
+            maxWidth = max(1, maxWidth - chrome.width())
+        shown, size = textMeasurer.measure(text, label.font(), maxWidth, wrap)
+        # A new QSize, the measured one is shared through the cache
+        size = size + chrome
+        label.setWordWrap(wrap and maxWidth > 0)
+        label.setText(shown)
+        label.setFixedSize(size)
+        return size
+
+    def _applyText(self):
+        # Labels are measured with cached font metrics and fixed to that size, the window is laid out once
+        titleSize = self._layoutLabel(self._labelTitle, self._chrome[0], self.config.TITLE, False)
+        messageSize = appNameSize = QtCore.QSize(0, 0)
+        if self.config.MESSAGE != "":
+            messageSize = self._layoutLabel(self._labelMessage, self._chrome[1], self.config.MESSAGE, True)
+        if self.config.APP_NAME != "":
+            appNameSize = self._layoutLabel(self._labelAppName, self._chrome[2], self.config.APP_NAME, False)
+        self._textSize = QtCore.QSize(max(titleSize.width(), messageSize.width(), appNameSize.width()),
+                                      titleSize.height() + messageSize.height() + appNameSize.height())
+
+        self._labelMessage.setVisible(self.config.MESSAGE != "")
+        self._labelAppName.setVisible(self.config.APP_NAME != "")
+
+    def _applyImage(self):
+        self._hLayout.removeItem(self._textLayout)
+        self._hLayout.removeWidget(self._limage)
+
+        hasImg = hasImage(self.config.IMAGE)
+        if (hasImg and self.config.IMAGE_ALIGN == ImageAlign.RIGHT) or not hasImg:
+            self._hLayout.addLayout(self._textLayout)
+
+        self._imageRequest += 1
+        self._imageStart = time.perf_counter()
+        if hasImg:
+            # Decoding happens on a worker thread, the label keeps its size until the pixmap arrives
+            pixmap = imageLoader().load(self.config.IMAGE, self.config.IMAGE_CROP, self.config.IMAGE_SIZE, self._pixelRatio(),
+                                        lambda pm, request=self._imageRequest: self._onImageLoaded(request, pm))
+            if pixmap is not None:
+                self._limage.setPixmap(pixmap)
+                if metrics._metrics is not None:
+                    metrics._metrics._record("image", self, time.perf_counter() - self._imageStart)
+            else:
+                self._limage.clear()
+            self._limage.setFixedSize(self.config.IMAGE_SIZE.x, self.config.IMAGE_SIZE.y)
+            self._hLayout.addWidget(self._limage)
+            self._limage.show()
+        else:
+            self._limage.clear()
+            self._limage.setFixedSize(0, 0)
+            self._limage.hide()
+
+        if (hasImg and self.config.IMAGE_ALIGN == ImageAlign.LEFT):
+            self._hLayout.addLayout(self._textLayout)
+
+    def _applyProgress(self):
+        if self.config.PROGRESS is None:
+            self._progress.hide()
+            return
+        # A negative value shows a busy indicator
+        if self.config.PROGRESS < 0:
+            self._progress.setRange(0, 0)
+        else:
+            self._progress.setRange(0, 100)
+            self._progress.setValue(min(100, self.config.PROGRESS))
+        self._progress.show()
+
+    def _applyActions(self):
+        # Reuse action widgets of the same type, drop the rest
+        oldActions = self._actions
+        self._actions = dict()
+        for key, action in self.config.ACTIONS.items():
+            wtype = QtWidgets.QLineEdit if action.type == ActionType.TEXT else QtWidgets.QComboBox
+            w = oldActions.pop(key, None)
+            if w is not None and type(w) is not wtype:
+                self._actionsLayout.removeWidget(w)
+                w.deleteLater()
+                w = None
+            if w is None:
+                w = wtype(self)
+                w.setObjectName("toastAction")
+                self._actionsLayout.addWidget(w)
+            w.setToolTip(action.help)
+            self._setStyleSheet(w, action.style)
+            if action.type == ActionType.TEXT:
+                self._disconnect(w.textChanged)
+                self._disconnect(w.editingFinished)
+                w.clear()
+                if action.callback is not None:
+                    w.textChanged.connect(action.callback)
+                w.editingFinished.connect(lambda k=key, w=w: self._onUsed(k, w.text()))
+            else:
+                self._disconnect(w.currentIndexChanged)
+                self._disconnect(w.activated)
+                self._applyOptions(w, action.options)
+                if action.callback is not None:
+                    # Not currentTextChanged, a search box would report every key press
+                    w.currentIndexChanged.connect(lambda i, w=w, callback=action.callback: callback(w.itemText(i)))
+                w.activated.connect(lambda i, k=key, w=w: self._onUsed(k, w.itemText(i)))
+            self._actions[key] = w
+        for w in oldActions.values():
+            self._actionsLayout.removeWidget(w)
+            w.deleteLater()
+
+    def _applyOptions(self, w: QtWidgets.QComboBox, options):
+        # The combo box shows a model shared with every toast that has the same options,
+        # the widget keeps it alive while it is in use
+        model = optionModels.get(options)
+        if w.model() is not model:
+            w.setModel(model)
+            w._optionModel = model
+        w.setCurrentIndex(0 if len(options) > 0 else -1)
+
+        large = len(options) >= _MEASURED_OPTIONS
+        policy = QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon if large else QtWidgets.QComboBox.AdjustToContentsOnFirstShow
+        if w.sizeAdjustPolicy() != policy:
+            w.setSizeAdjustPolicy(policy)
+        if large:
+            w.setMinimumContentsLength(20)
+            w.view().setUniformItemSizes(True)
+
+        filterMin = self.config.SELECT_FILTER_MIN
+        if filterMin > 0 and len(options) >= filterMin:
+            # Typing filters the options, only entries of the list can be picked
+            w.setEditable(True)
+            w.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
+            w.lineEdit().setPlaceholderText("Search")
+            completer = w.completer()
+            completer.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+            completer.setFilterMode(QtCore.Qt.MatchContains)
+            completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        elif w.isEditable():
+            w.setEditable(False)
+
+    def _applyButtons(self):
+        # Buttons are reused by position, surplus ones are hidden
+        self._buttons = dict()
+        for i, (key, button) in enumerate(self.config.BUTTONS.items()):
+            if i < len(self._buttonWidgets):
+                w = self._buttonWidgets[i]
+                self._disconnect(w.clicked)
+                w.setText(button.text)
+            else:
+                w = QtWidgets.QPushButton(button.text, self)
+                w.setObjectName("toastButton")
+                self._buttonWidgets.append(w)
+                self._buttonsLayout.addWidget(w)
+            self._setStyleSheet(w, button.style)
+            if button.callback is not None:
+                w.clicked.connect(button.callback)
+            w.clicked.connect(lambda checked=False, k=key: self._onUsed(k))
+            if button.icon:
+                w.setIcon(iconCache.get(button.icon))
+            else:
+                w.setIcon(QtGui.QIcon())
+            w.show()
+            self._buttons[key] = w
+        for w in self._buttonWidgets[len(self.config.BUTTONS):]:
+            self._disconnect(w.clicked)
+            w.hide()
+
+    def _estimateSize(self) -> QtCore.QSize:
+        imageSize = self._limage.minimumSize()
+        width = imageSize.width() + self._textSize.width() + self.config.CONTENT_SPACE
+        height = max(imageSize.height(), self._textSize.height()) + self.config.CONTENT_SPACE
+
+        if self.config.PROGRESS is not None:
+            height += self._progress.sizeHint().height() + self._mainLayout.spacing()
+
+        for w in self._actions.values():
+            if isinstance(w, QtWidgets.QLineEdit):
+                width += w.sizeHint().width()
+            else:
+                height += w.sizeHint().height() + self._hLayout.spacing()
+
+        if self.config.hasButtons():
+            height += self.config.CONTENT_SPACE
+        if self.config.hasActions():
+            height += self.config.CONTENT_SPACE
+
+        if len(self._buttons) > 0:
+            height += self._buttonWidgets[len(self._buttons) - 1].sizeHint().height()
+        return QtCore.QSize(width, height)
+
+    def _onImageLoaded(self, request: int, pixmap: QtGui.QPixmap):
+        if request != self._imageRequest:
+            return
+        try:
+            self._limage.setPixmap(pixmap)
+        except RuntimeError:
+            # The toast was deleted while the image was decoding
+            return
+        if metrics._metrics is not None:
+            metrics._metrics._record("image", self, time.perf_counter() - self._imageStart)
+
+    def _onUsed(self, name: str, value: str|None = None):
+        if self._history is not None and self._historyId is not None:
+            self._history.markUsed(self._historyId, name, value)
+
+    def _dropResources(self):
+        # Pixmaps are not kept while a recycled toast waits for its next show
+        self._imageRequest += 1
+        if self._isUiBuilt:
+            self._limage.clear()
+        self._background = None
+        self._backgroundKey = None
+
+    def _resize(self):
+        size = self._estimateSize()
+        if size != self._size:
+            self._size = size
+            self.resize(size)
+            if self._stack is not None:
+                self._stack._resized(self)
+            else:
+                self._moveToast()
+
+    def _restyle(self):
+        # Called by the theme manager, the widgets of a shown toast are restyled in place
+        if not self._isUiBuilt or self.__isClosed:
+            return
+        self._applyStyle()
+        self._applyText()
+        self._resize()
+        self.update()
+
+    def _isHiding(self) -> bool:
+        return self.__isHide or self.__isClosed
+
+    def _reset(self):
+        # Bring a hidden toast back to its freshly constructed state, whoever shows it next
+        # attaches its own stack, history and driver
+        self._stopAnimations()
+        self.__isHide = False
+        self.__isClosed = False
+        self.setWindowOpacity(1.0)
+        if self._stack is not None:
+            self._stack._detach(self)
+        self._history = None
+        self._historyId = None
+        self._driver = None
+
+    def _hideAnimation(self):
+        if self.__isHide:
+            return
+        self.__isHide = True
+        self._stopExpiry()
+
+        self._animate(1.0, 0.0 if self.config.USE_ANIM_FADE else 1.0,
+                      QtCore.QPoint(self._x, self._y),
+                      QtCore.QPoint(self._x, self._y) + QtCore.QPoint(self.config.ANIM_POS_OFFSET.x, self.config.ANIM_POS_OFFSET.y))
+
+    def _animate(self, startOpacity: float, endOpacity: float, startPos: QtCore.QPoint, endPos: QtCore.QPoint):
+        if self._driver is not None:
+            self._driver.animate(self, self.config.ANIM_SHOW_HIDE_TIME, (startOpacity, endOpacity), (startPos, endPos),
+                                 self.config.ANIM_FADE_CURVE, self.config.ANIM_POS_CURVE, self._hide)
+            return
+        self._animation.setEasingCurve(self.config.ANIM_FADE_CURVE)
+        self._animation.setDuration(self.config.ANIM_SHOW_HIDE_TIME)
+        self._animation.setStartValue(startOpacity)
+        self._animation.setEndValue(endOpacity)
+        self._animation.start()
+
+        self._animationPos.setEasingCurve(self.config.ANIM_POS_CURVE)
+        self._animationPos.setDuration(self.config.ANIM_SHOW_HIDE_TIME)
+        self._animationPos.setStartValue(startPos)
+        self._animationPos.setEndValue(endPos)
+        self._animationPos.start()
+
+    def _startExpiry(self, msec: int):
+        # Every toast counts down in one shared scheduler, it pauses on hover and while the user is idle
+        expiryScheduler().schedule(self, msec)
+
+    def _stopExpiry(self):
+        expiryScheduler().unschedule(self)
+
+    def _stopAnimations(self):
+        if self._driver is not None:
+            self._driver.cancel(self)
+        self._stopExpiry()
+        self._animation.stop()
+        self._animationPos.stop()
+
+    def _hide(self, force: bool=False):
+        if not force and not self.__isHide and not self.__isClosed and metrics._metrics is not None:
+            # Called at the end of the show animation too
+            metrics._metrics._record("shown", self, time.perf_counter() - self._showStart)
+        if (force or self.windowOpacity() == 0) and not self.__isClosed:
+            self.__isClosed = True
+            self._stopAnimations()
+            QtWidgets.QWidget.hide(self)
+            if self._history is not None and self._historyId is not None:
+                self._history.markHidden(self._historyId)
+            if metrics._metrics is not None:
+                metrics._metrics._record("hide", self, time.perf_counter() - self._showStart)
+            self.popuphidden.emit()
+            if _EXIT_ON_HIDE:
+                sys.exit()
+            if self._deleteOnHide:
+                # Layouts, labels, timers and animations are children and go with the toast
+                self.deleteLater()
+
+    def _moveToast(self):
+        if self._stack is not None:
+            self._x, self._y = self._stack._place(self)
+            self.setGeometry(self._x, self._y, self.width(), self.height())
+            return
+        screen_geometry = screenCache().availableGeometry(self._screen)
+        screen_size = (screen_geometry.width(), screen_geometry.height())
+        win_size = (self.width(), self.height())
+        self._x, self._y = 0, 0
+        if self.config.SHOW_POS == ShowPosType.BOTTOM_RIGHT:
+            self._x = screen_size[0] - win_size[0] - self.config.POS_OFFSET.x
+            self._y = screen_size[1] - win_size[1] - self.config.POS_OFFSET.y
+        elif self.config.SHOW_POS == ShowPosType.BOTTOM_LEFT:
+            self._x = self.config.POS_OFFSET.x
+            self._y = screen_size[1] - win_size[1] - self.config.POS_OFFSET.y
+        elif self.config.SHOW_POS == ShowPosType.TOP_RIGHT:
+            self._x = screen_size[0] - win_size[0] - self.config.POS_OFFSET.x
+            self._y = self.config.POS_OFFSET.y
+        elif self.config.SHOW_POS == ShowPosType.TOP_LEFT:
+            self._x = self.config.POS_OFFSET.x
+            self._y = self.config.POS_OFFSET.y
+        self._x += screen_geometry.left()
+        self._y += screen_geometry.top()
+        self.setGeometry(self._x, self._y, self.width(), self.height())
+
+    def _moveTo(self, x: int, y: int):
+        # Used by ToastStack to slide a shown toast into its new slot
+        if self._x == x and self._y == y:
+            return
+        self._x, self._y = x, y
+        if self.__isHide or not self.isVisible():
+            return
+        if self._driver is not None:
+            self._driver.animate(self, self.config.ANIM_SHOW_HIDE_TIME, pos=(self.pos(), QtCore.QPoint(x, y)), posCurve=self.config.ANIM_POS_CURVE)
+            return
+        self._animationPos.stop()
+        self._animationPos.setDuration(self.config.ANIM_SHOW_HIDE_TIME)
+        self._animationPos.setStartValue(self.pos())
+        self._animationPos.setEndValue(QtCore.QPoint(x, y))
+        self._animationPos.start()
+
+    #------PUBLIC------
+
+    def show(self):
+        self._showStart = time.perf_counter()
+        self._paintPending = True
+        self._setupUi()
+        if self.config.SOUND != "":
+            soundPlayer().play(self.config.SOUND)
+        if self._history is not None:
+            self._historyId = self._history.record(self.config)
+
+        if self.config.USE_ANIM_FADE:
+            self.setWindowOpacity(0.0)
+        self._moveToast()
+        QtWidgets.QWidget.show(self)
+        self._animate(0.0 if self.config.USE_ANIM_FADE else 1.0, 1.0,
+                      QtCore.QPoint(self._x, self._y) + QtCore.QPoint(self.config.ANIM_POS_OFFSET.x, self.config.ANIM_POS_OFFSET.y),
+                      QtCore.QPoint(self._x, self._y))
+        if (self.config.DURATION > 0):
+            self._startExpiry(self.config.DURATION)
+
+    def update(self, config: Config|None = None, restartTimer: bool = False):
+        # Apply a new config to a shown toast, touching only the widgets whose fields changed.
+        # Without a config this is QWidget.update() and schedules a repaint.
+        if config is None:
+            QtWidgets.QWidget.update(self)
+            return
+        old = self.config
+        self.config = config
+        if not self._isUiBuilt or self.__isClosed or self.__isHide:
+            return
+        changed = set()
+        for name in _UPDATE_FIELDS:
+            a, b = getattr(old, name), getattr(config, name)
+            if a is not b and a != b:
+                changed.add(name)
+        if changed & _STYLE_FIELDS:
+            self._applyStyle()
+        if changed & (_TEXT_FIELDS | _STYLE_FIELDS):
+            self._applyText()
+        if changed & _TEXT_FIELDS and self._history is not None and self._historyId is not None:
+            self._history.update(self._historyId, config)
+        if changed & _IMAGE_FIELDS:
+            self._applyImage()
+        if "PROGRESS" in changed:
+            self._applyProgress()
+        if (old.hasActions() or config.hasActions()) and (old.ACTIONS != config.ACTIONS or old.SELECT_FILTER_MIN != config.SELECT_FILTER_MIN):
+            self._applyActions()
+        if (old.hasButtons() or config.hasButtons()) and old.BUTTONS != config.BUTTONS:
+            self._applyButtons()
+
+        self._resize()
+        if restartTimer and self.config.DURATION > 0:
+            self._startExpiry(self.config.DURATION)
+
+    #------EVENTS------
+
+    def paintEvent(self, event):
+        if self._paintPending:
+            self._paintPending = False
+            if metrics._metrics is not None:
+                metrics._metrics._record("first_paint", self, time.perf_counter() - self._showStart)
+        bg = self._bgColor
+        pr = self._renderPr if self._renderPr is not None else self.devicePixelRatioF()
+        key = (self.width(), self.height(), bg.r, bg.g, bg.b, bg.a, pr)
+        # The background is rendered once per size and colour, a frame is a single blit
+        if key != self._backgroundKey:
+            self._backgroundKey = key
+            self._background = backgroundPixmap(self.width(), self.height(), QtGui.QColor(bg.r, bg.g, bg.b, bg.a), pr)
+        customPainter = QtGui.QPainter(self)
+        customPainter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        customPainter.drawPixmap(0, 0, self._background)
+
+    def changeEvent(self, event):
+        # The application stylesheet was replaced, Qt repolished the labels with their first fonts
+        if event.type() == QtCore.QEvent.StyleChange and self._isUiBuilt:
+            QtCore.QTimer.singleShot(0, self._applyFonts)
+        super(Toast, self).changeEvent(event)
+
+    def enterEvent(self, event):
+        if self.config.PAUSE_ON_HOVER:
+            expiryScheduler().hold(self)
+
+    def leaveEvent(self, event):
+        expiryScheduler().release(self)
+
+    def closeEvent(self, event):
+        # close() ends the toast like a hide, so stacks and dispatchers let go of it
+        self._hide(True)
+        event.accept()
+
+    def mousePressEvent(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self._dragPosition = event.globalPos() - self.frameGeometry().topLeft()
+            event.accept()
+
+        if event.buttons() == QtCore.Qt.MidButton:
+            self._hideAnimation()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == QtCore.Qt.LeftButton and self.config.DRAG_SUPPORT:
+            self.move(event.globalPos() - self._dragPosition)
+            event.accept()
+
+    #------SETTERS------
+
+    def setConfig(self, config: Config):
+        self.config = config
+
+    def setDeleteOnHide(self, data: bool):
+        # Standalone toasts are deleted once hidden, a pool keeps its toasts for reuse
+        self._deleteOnHide = data
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, data)
+
+    def setHistory(self, data):
+        self._history = data
+
+    def setAnimationDriver(self, data):
+        self._stopAnimations()
+        self._driver = data
+
+    def setTitle(self, data: str, fontSize: int = 14, style: str = ""):
+        self.config.TITLE = data
+        self.config.TITLE_FONT_SIZE = fontSize
+        self.config.TITLE_STYLE = style
+
+    def setMessage(self, data: str, fontSize: int = 12, style: str = ""):
+        self.config.MESSAGE = data
+        self.config.MESSAGE_FONT_SIZE = fontSize
+        self.config.MESSAGE_STYLE = style
+
+    def setAppName(self, data: str, fontSize: int = 10, style: str = ""):
+        self.config.APP_NAME = data
+        self.config.APP_NAME_FONT_SIZE = fontSize
+        self.config.APP_NAME_STYLE = style
+
+    def setTheme(self, data: str):
+        self.config.THEME = data
+
+    def setTextAlign(self, data: TextAlign):
+        self.config.TEXT_ALIGN = data
+
+    def setSound(self, data: str):
+        self.config.SOUND = data
+
+    def setDragToast(self, data: bool):
+        self.config.DRAG_SUPPORT = data
+
+    def setImage(self, data: str|bytes|QtGui.QImage):
+        self.config.IMAGE = data
+
+    def setImageSize(self, data: int) :
+        self.config.IMAGE_SIZE = Vec2(data, data)
+
+    def setImageSize(self, data1: int, data2: int):
+        self.config.IMAGE_SIZE = Vec2(data1, data2)
+
+    def setImageAlign(self, data: ImageAlign):
+        self.config.IMAGE_ALIGN = data
+
+    def setImageCrop(self, data: ImageCrop):
+        self.config.IMAGE_CROP = data
+
+    def setProgress(self, data: int|None):
+        self.config.PROGRESS = data
+
+    def setDuration(self, data: int):
+        self.config.DURATION = data
+
+    def setPauseOnHover(self, data: bool):
+        self.config.PAUSE_ON_HOVER = data
+
+    def setAnimTime(self, data: int):
+        self.config.ANIM_SHOW_HIDE_TIME = data
+
+    def setAnimUseFade(self, data: bool):
+        self.config.USE_ANIM_FADE = data
+
+    def setAnimFadeCurve(self, data: CurveType):
+        self.config.ANIM_FADE_CURVE = data
+
+    def setAnimPosOffset(self, x: int, y: int):
+        self.config.ANIM_POS_OFFSET = Vec2(x, y)
+
+    def setAnimPosCurve(self, data: CurveType):
+        self.config.ANIM_POS_CURVE = data
+
+    def setPosOffset(self, x: int, y: int):
+        self.config.POS_OFFSET = Vec2(x, y)
+
+    def setShowPos(self, data: ShowPosType):
+        self.config.SHOW_POS = data
+
+    def setSpaceTextImage(self, data: int):
+        self.config.CONTENT_SPACE = data
+
+    def setBgColor(self, data: Color):
+        self.config.BG_COLOR = data
+
+    def setFgColor(self, data: Color):
+        self.config.FG_COLOR = data
+
+    def addButton(self, name: str, data: Button):
+        self.config.BUTTONS[name] = data
+
+    def clearButtons(self):
+        self.config.BUTTONS = dict()
+
+    def addAction(self, name: str, data: Action):
+        self.config.ACTIONS[name] = data
+
+    def clearActions(self):
+        self.config.ACTIONS = dict()
+    
+    def setUseBlurBg(self, data: bool):
+        self.config.USE_BLUR_BG = data
+
+    def setUseBlurAcrilicBg(self, data: bool):
+        self.config.USE_ACRILIC = data
+
+    def setIsBlurDark(self, data: bool):
+        self.config.IS_BLUR_DARK = data